@@ -1,8 +1,15 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 from app.api.routers.project import router as project_router
 from app.api.routers.places import router as place_router
+from app.api.routers.places import direct_router as direct_place_router
+from app.api.routers.catalog import router as catalog_router
+from app.api.middleware.middleware import AdmissionControlMiddleware, MetricsMiddleware, ProfilingMiddleware
+from app.core.metrics.metrics import EventLoopLagMonitor, metrics_registry
+from app.core.config.config import admission_settings, metrics_settings, profiling_settings
 from app.services.artic_place_fetcher.artic_place_fetcher import ArticPlaceFetcher
+from app.services.artic_place_fetcher.models.models import CatalogReadiness
 import asyncio
 from datetime import datetime
 from app.services.travel_manager.errors.errors import *
@@ -14,15 +21,25 @@ import uvicorn
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # --- Startup Logic ---
-    # Initialize the Singleton Fetcher and load data into memory
+    # Initialize the Singleton Fetcher, the catalog loads in the background while
+    # requests are already served; /health/ready reports when it is done
     fetcher = ArticPlaceFetcher()
-    print("Initializing Artic Place Fetcher cache...")
-    await fetcher.fetch_all_places()
-    print(f"Successfully cached {len(fetcher._places)} locations.")
+    print("Loading Artic Place Fetcher cache in the background...")
+    fetcher.start_loading()
+    # Restores stored projects when a persistent backend is configured
+    travel_manager = TravelManager()
+    loop_lag_monitor = EventLoopLagMonitor(metrics_settings.LOOP_LAG_INTERVAL, metrics_registry)
+    if metrics_settings.ENABLED:
+        loop_lag_monitor.start()
     
     yield
     # --- Shutdown Logic ---
     print("Shutting down Travel Planner API...")
+    await loop_lag_monitor.stop()
+    await fetcher.stop_loading()
+    await fetcher.stop_background_refresh()
+    await fetcher.aclose()
+    travel_manager.close()
 
 # Initialize FastAPI with the lifespan handler
 app = FastAPI(
@@ -31,10 +48,66 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# The last one added runs first: metrics also count shed requests, queued
+# requests aren't profiled while they wait
+if profiling_settings.ENABLED or profiling_settings.HEADER_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+if admission_settings.ENABLED:
+    app.add_middleware(AdmissionControlMiddleware)
+if metrics_settings.ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include your routers
 app.include_router(project_router)
 app.include_router(place_router)
+app.include_router(catalog_router)
+# After the catalog router, so /places/search isn't taken for a place id
+app.include_router(direct_place_router)
+
+# Seconds a client is told to wait when the catalog isn't loaded yet
+CATALOG_RETRY_AFTER = 5
+
+
+@app.exception_handler(CatalogNotReadyError)
+async def catalog_not_ready_handler(request: Request, exc: CatalogNotReadyError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": exc.message},
+        headers={"Retry-After": str(CATALOG_RETRY_AFTER)},
+    )
+
+
+@app.exception_handler(ArticUpstreamError)
+async def artic_upstream_error_handler(request: Request, exc: ArticUpstreamError):
+    # The place may well exist, Artic just couldn't confirm it
+    return JSONResponse(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        content={"detail": exc.message},
+    )
+
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    """Always 200 while the process runs, status tells whether the catalog is loaded."""
+    return {"status": "healthy" if ArticPlaceFetcher().is_ready else "starting"}
+
+
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe: the process is up and its event loop responds."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", response_model=CatalogReadiness)
+async def readiness():
+    """Readiness probe: 503 until the Artic catalog is loaded, with the load progress."""
+    readiness = ArticPlaceFetcher().readiness
+    status_code = status.HTTP_200_OK if readiness.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(status_code=status_code, content=readiness.model_dump(mode="json"))
+
+
+if metrics_settings.ENABLED:
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Prometheus text exposition of this worker's request, catalog and project metrics."""
+        return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
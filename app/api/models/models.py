@@ -2,7 +2,8 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import List, Annotated
-from annotated_types import MaxLen
+from annotated_types import MaxLen, MinLen
+from app.core.config.config import travel_project_settings
 
 # --- Place Schemas ---
 class PlaceSchema(BaseModel):
@@ -20,6 +21,28 @@ class PlaceResponse(PlaceSchema):
     id: int
     visited: bool
 
+class ProjectPlaceResponse(PlaceResponse):
+    project_id: int
+
+class PlaceBulkCreate(BaseModel):
+    places: Annotated[list[PlaceCreate], MinLen(1), MaxLen(travel_project_settings.BULK_LIMIT)]
+
+class PlaceBulkItemResult(BaseModel):
+    # HTTP status the single-item endpoint would have answered with
+    status_code: int
+    place: PlaceResponse | None = None
+    error: str | None = None
+
+class PlaceBulkResponse(BaseModel):
+    results: List[PlaceBulkItemResult]
+    created: int
+    failed: int
+
+class PlaceSearchResult(BaseModel):
+    artic_id: int
+    name: str
+    score: float
+
 # --- Project Schemas ---
 class ProjectShema(BaseModel):
     name: str
@@ -36,4 +59,37 @@ class ProjectUpdate(ProjectShema):
 
 class ProjectResponse(ProjectShema):
     id: int
-    places: List[PlaceResponse] | None = None
\ No newline at end of file
+    places: List[PlaceResponse] | None = None
+
+class ProjectSearchResult(BaseModel):
+    score: float
+    project: ProjectResponse
+
+class ProjectSearchResponse(BaseModel):
+    results: List[ProjectSearchResult]
+    total: int
+    limit: int
+    offset: int
+
+class ProjectCreateResult(BaseModel):
+    project: ProjectResponse
+    warnings: List[str]
+    status: str
+
+class ProjectBulkCreate(BaseModel):
+    projects: Annotated[list[ProjectCreate], MinLen(1), MaxLen(travel_project_settings.BULK_LIMIT)]
+
+class ProjectBulkResponse(BaseModel):
+    results: List[ProjectCreateResult]
+    created: int
+    partial: int
+
+class ProjectPage(BaseModel):
+    items: List[ProjectResponse]
+    next_cursor: str | None = None
+
+class ResponseCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
\ No newline at end of file
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Query, Depends
+from app.api.models.models import *
+from app.services.artic_place_fetcher.artic_place_fetcher import ArticPlaceFetcher
+from app.services.artic_place_fetcher.models.models import CatalogRefreshInfo
+
+router = APIRouter(tags=["Catalog"])
+
+async def get_artic_place_fetcher()->ArticPlaceFetcher:
+    return ArticPlaceFetcher()
+
+@router.get("/catalog/", response_model=CatalogRefreshInfo)
+async def catalog_status(fetcher: ArticPlaceFetcher = Depends(get_artic_place_fetcher)):
+    """
+    Reports when the Artic catalog was last refreshed, how long it took and how many places it holds.
+    """
+    return fetcher.refresh_info
+
+
+@router.get("/places/search", response_model=List[PlaceSearchResult])
+async def search_places(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=50),
+    fetcher: ArticPlaceFetcher = Depends(get_artic_place_fetcher)
+):
+    """
+    Prefix and typo-tolerant search over the cached Artic catalog, best match first.
+    Use the returned name when adding a place to a project.
+    """
+    await fetcher.wait_until_ready()
+    return [
+        PlaceSearchResult(artic_id=artic_id, name=name, score=score)
+        for artic_id, name, score in fetcher.search_places(q, limit)
+    ]
@@ -1,12 +1,18 @@
-from fastapi import APIRouter, HTTPException, status, Query, Depends
+from fastapi import APIRouter, HTTPException, status, Query, Depends, Response
 from app.api.models.models import *
 from app.services.travel_manager.errors.errors import *
+from app.services.artic_place_fetcher.errors.errors import *
 from app.services.travel_manager.travel_manager import TravelManager
 
 router = APIRouter(prefix="/projects/{project_id}/places", tags=["Places"])
+# Places addressed by their global id, no project id needed
+direct_router = APIRouter(prefix="/places", tags=["Places"])
 
 async def get_travel_manager()->TravelManager:
-    return TravelManager()
+    travel_manager = TravelManager()
+    # Catch up with what other workers wrote to a shared store
+    await travel_manager.run_blocking(travel_manager.sync)
+    return travel_manager
 
 @router.post("/", response_model=PlaceResponse, status_code=status.HTTP_201_CREATED)
 async def add_place_to_project(project_id: int, place_data: PlaceCreate, travel_manager:TravelManager = Depends(get_travel_manager)):
@@ -21,19 +27,75 @@ async def add_place_to_project(project_id: int, place_data: PlaceCreate, travel_
         
     except ProjectNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    except PlaceNotFoundError as e:
+    except (PlaceNotFoundError, ArticPlaceNotFoundError) as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except (DuplicatePlaceError, ProjectHasMaxPlacesAllowedError) as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
+@router.post("/bulk", response_model=PlaceBulkResponse)
+async def add_places_to_project(
+    project_id: int,
+    bulk_data: PlaceBulkCreate,
+    response: Response,
+    travel_manager:TravelManager = Depends(get_travel_manager)
+):
+    """
+    Adds up to TRAVEL_PROJ_BULK_LIMIT places in one request, names are validated against
+    Artic in one pass. Each item gets the status the single-place endpoint would return,
+    the response is 207 if any place was rejected.
+    """
+    try:
+        outcomes = await travel_manager.add_places_to_project(project_id, bulk_data.places)
+    except ProjectNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+
+    results = []
+    for outcome in outcomes:
+        if isinstance(outcome, PlaceResponse):
+            results.append(PlaceBulkItemResult(status_code=status.HTTP_201_CREATED, place=outcome))
+        elif isinstance(outcome, ArticPlaceNotFoundError):
+            results.append(PlaceBulkItemResult(status_code=status.HTTP_400_BAD_REQUEST, error=str(outcome)))
+        elif isinstance(outcome, ArticUpstreamError):
+            results.append(PlaceBulkItemResult(status_code=status.HTTP_502_BAD_GATEWAY, error=str(outcome)))
+        else:
+            results.append(PlaceBulkItemResult(status_code=status.HTTP_409_CONFLICT, error=str(outcome)))
+
+    failed = sum(1 for result in results if result.place is None)
+    response.status_code = status.HTTP_207_MULTI_STATUS if failed else status.HTTP_201_CREATED
+
+    return PlaceBulkResponse(results=results, created=len(results) - failed, failed=failed)
+
+
 @router.patch("/{place_id}/visited", response_model=PlaceResponse)
 async def mark_visited(project_id: int, place_id: int, travel_manager:TravelManager = Depends(get_travel_manager)):
     """
     Sets visited = True. Returns 400 if user tries to unmark or if place doesn't exist.
     """
     try:
-        updated_project = travel_manager.mark_place_visited(project_id, place_id)
+        updated_project = await travel_manager.run_blocking(travel_manager.mark_place_visited, project_id, place_id)
         return updated_project
     except (ProjectNotFoundError, PlaceNotFoundError) as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@direct_router.get("/{place_id}", response_model=ProjectPlaceResponse)
+async def get_place(place_id: int, travel_manager:TravelManager = Depends(get_travel_manager)):
+    """
+    Retrieves a place and the id of its project by the place ID alone.
+    """
+    try:
+        return travel_manager.get_place_by_id(place_id)
+    except PlaceIdNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@direct_router.patch("/{place_id}/visited", response_model=ProjectPlaceResponse)
+async def mark_place_visited(place_id: int, travel_manager:TravelManager = Depends(get_travel_manager)):
+    """
+    Sets visited = True on a place without knowing its project. Unmarking is prohibited.
+    """
+    try:
+        return await travel_manager.run_blocking(travel_manager.mark_place_visited_by_id, place_id)
+    except PlaceIdNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,12 +1,71 @@
-from fastapi import APIRouter, HTTPException, status, Query, Depends, Response
+import zlib
+from typing import Iterator
+from fastapi import APIRouter, HTTPException, status, Query, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from app.api.models.models import *
+from app.core.config.config import travel_project_settings
 from app.services.travel_manager.travel_manager import TravelManager
 from app.services.travel_manager.errors.errors import *
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
+# Export lines are sent in chunks of about this many bytes
+EXPORT_CHUNK_SIZE = 64 * 1024
+# Seconds a client is told to wait while the search index is built
+SEARCH_RETRY_AFTER = 2
+
 async def get_travel_manager()->TravelManager:
-    return TravelManager()
+    travel_manager = TravelManager()
+    # Catch up with what other workers wrote to a shared store
+    await travel_manager.run_blocking(travel_manager.sync)
+    return travel_manager
+
+
+def _cache_headers(etag: str) -> dict[str, str]:
+    max_age = travel_project_settings.CACHE_MAX_AGE
+    cache_control = f"public, max-age={max_age}, must-revalidate" if max_age > 0 else "no-cache"
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def _export_chunks(lines: Iterator[bytes], compress: bool) -> Iterator[bytes]:
+    """
+    Groups NDJSON lines into EXPORT_CHUNK_SIZE chunks, optionally gzipped. The first
+    line goes out alone so the client gets its first byte right away; every gzip chunk
+    is sync-flushed so it can be decompressed as soon as it arrives.
+    """
+    # wbits=31 writes the gzip container instead of raw zlib
+    compressor = zlib.compressobj(wbits=31) if compress else None
+
+    def encode(data: bytes) -> bytes:
+        return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH) if compressor else data
+
+    buffer: list[bytes] = []
+    size = 0
+    first = True
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if first or size >= EXPORT_CHUNK_SIZE:
+            yield encode(b"".join(buffer))
+            buffer.clear()
+            size = 0
+            first = False
+
+    tail = b"".join(buffer)
+    if compressor:
+        yield compressor.compress(tail) + compressor.flush()
+    elif tail:
+        yield tail
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match uses the weak comparison, W/ prefixes are ignored."""
+    header = request.headers.get("If-None-Match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
 
 @router.post("/")
 async def create_project(
@@ -30,36 +89,128 @@ async def create_project(
         "status": result_status
     }
 
+@router.post("/bulk", response_model=ProjectBulkResponse)
+async def create_projects_bulk(
+    bulk_data: ProjectBulkCreate,
+    response: Response,
+    travel_manager: TravelManager = Depends(get_travel_manager)
+):
+    """
+    Creates up to TRAVEL_PROJ_BULK_LIMIT projects in one request. Place names of all
+    projects are validated against Artic in one pass, each project reports its own
+    warnings like POST /projects/ does. 207 if any project was only partially created.
+    """
+    created = await travel_manager.create_projects(bulk_data.projects)
+
+    results = [
+        ProjectCreateResult(
+            project=project.get_response_model(),
+            warnings=warnings,
+            status="partial_success" if warnings else "success",
+        )
+        for project, warnings in created
+    ]
+    partial = sum(1 for result in results if result.warnings)
+    response.status_code = status.HTTP_207_MULTI_STATUS if partial else status.HTTP_201_CREATED
+
+    return ProjectBulkResponse(results=results, created=len(results), partial=partial)
+
 @router.get("/", response_model=List[ProjectResponse])
 async def list_projects(
+    request: Request,
     limit: int = Query(10, le=100), 
     offset: int = 0,
     name_filter: str | None = None,
+    cursor: str | None = None,
     travel_manager: TravelManager = Depends(get_travel_manager)
 ):
     """
     Lists projects with pagination and optional name filtering.
+    Pass the X-Next-Cursor header of a page as `cursor` to get the next one,
+    cursors stay stable when projects are created or removed in between.
+    Send the ETag back in If-None-Match to get 304 while no project has changed.
     """
-    all_projects = travel_manager.list_projects()
+    # Read before the page is built, see TravelManager.get_project_etag
+    etag = travel_manager.get_collection_etag()
+    headers = _cache_headers(etag)
+    if _not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    try:
+        payload, next_cursor = travel_manager.query_projects_json(limit, offset, name_filter, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Already serialized from the response cache, skip FastAPI's validation and encoding
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return Response(content=payload, media_type="application/json", headers=headers)
 
-    # Apply Filtering
-    if name_filter:
-        all_projects = [
-            p for p in all_projects 
-            if name_filter.lower() in p.name.lower()
-        ]
 
-    # Apply Slicing for Pagination
-    return all_projects[offset : offset + limit]
+@router.get("/cache/stats", response_model=ResponseCacheStats)
+async def response_cache_stats(travel_manager: TravelManager = Depends(get_travel_manager)):
+    """
+    Hit/miss counters of the serialized project response cache.
+    """
+    return travel_manager.get_response_cache_stats()
+
+
+@router.get("/search", response_model=ProjectSearchResponse)
+async def search_projects(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    travel_manager: TravelManager = Depends(get_travel_manager)
+):
+    """
+    Full-text search over project names, descriptions, place names and place notes.
+    Every word of q must match, best match first; `total` counts all matches.
+    Answers 503 with Retry-After until the stored projects are indexed after startup.
+    """
+    try:
+        return travel_manager.search_projects(q, limit, offset)
+    except SearchIndexNotReadyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(SEARCH_RETRY_AFTER)},
+        )
+
+
+@router.get("/export")
+async def export_projects(
+    gzip: bool = Query(False, description="Compress the stream, sent with Content-Encoding: gzip"),
+    travel_manager: TravelManager = Depends(get_travel_manager)
+):
+    """
+    Streams every project with its places as NDJSON, one project per line, ascending ids.
+    Memory stays flat whatever the project count: lines are serialized as they are sent.
+    """
+    headers = {"Content-Disposition": 'attachment; filename="projects.ndjson"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    # A sync iterator, Starlette pulls it from the threadpool so serialization doesn't block the loop
+    return StreamingResponse(
+        _export_chunks(travel_manager.export_projects_ndjson(), gzip),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: int, travel_manager: TravelManager = Depends(get_travel_manager)):
+async def get_project(project_id: int, request: Request, travel_manager: TravelManager = Depends(get_travel_manager)):
     """
     Retrieves a single project by its ID.
+    Send the ETag back in If-None-Match to get 304 while the project is unchanged.
     """
     try:
-        return travel_manager.get_project_by_id(project_id).get_response_model()
+        etag = travel_manager.get_project_etag(project_id)
+        headers = _cache_headers(etag)
+        if _not_modified(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        payload = travel_manager.get_project_json(project_id)
+        return Response(content=payload, media_type="application/json", headers=headers)
     except ProjectNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
@@ -73,7 +224,7 @@ async def delete_project(project_id: int, travel_manager: TravelManager = Depend
     Removes a project. Fails if any place in the project is marked 'visited'.
     """
     try:
-        travel_manager.remove_project(project_id)
+        await travel_manager.run_blocking(travel_manager.remove_project, project_id)
         # 204 No Content returns no body, just success.
         return 
     except ProjectNotFoundError as e:
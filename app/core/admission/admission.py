@@ -0,0 +1,82 @@
+import asyncio
+import time
+from collections import deque
+
+# Why a request wasn't admitted
+QUEUE_FULL = "queue_full"
+QUEUE_TIMEOUT = "queue_timeout"
+
+
+class AdmissionLimiter:
+    """
+    At most limit requests in flight, then up to queue_size wait in FIFO order.
+    A finishing request hands its slot straight to the oldest waiter, so a burst
+    can't starve queued requests. Event-loop only, no thread safety needed.
+    """
+
+    def __init__(self, limit: int, queue_size: int):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def try_acquire(self) -> bool:
+        """Takes a free slot without waiting, never ahead of queued requests."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+        return False
+
+    async def acquire(self, deadline: float) -> str | None:
+        """
+        Takes a slot, queueing until deadline (time.monotonic()) at most.
+        Returns None once admitted, otherwise QUEUE_FULL or QUEUE_TIMEOUT.
+        """
+        if self.try_acquire():
+            return None
+
+        if len(self._waiters) >= self.queue_size:
+            return QUEUE_FULL
+
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            return QUEUE_TIMEOUT
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+            return None
+        except asyncio.TimeoutError:
+            if self._handed_over(waiter):
+                return None
+            return QUEUE_TIMEOUT
+        except asyncio.CancelledError:
+            # The client went away, a slot it was just given goes to the next waiter
+            if self._handed_over(waiter):
+                self.release()
+            raise
+
+    def _handed_over(self, waiter: asyncio.Future) -> bool:
+        """True if the waiter got a slot right as its wait ended, otherwise it leaves the queue."""
+        if waiter.done() and not waiter.cancelled():
+            return True
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        return False
+
+    def release(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot moves to the waiter, in_flight stays the same
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
@@ -4,6 +4,9 @@ import logging
 class AuctionSettings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_prefix="TRAVEL_PROJ_", env_file_encoding="utf-8", extra="ignore")
     PLACES_LIMIT:int = 10
+    RESPONSE_CACHE_SIZE: int = 10_000 # Serialized projects kept in memory, use TRAVEL_PROJ_RESPONSE_CACHE_SIZE
+    BULK_LIMIT: int = 500 # Max projects or places per bulk request, use TRAVEL_PROJ_BULK_LIMIT
+    CACHE_MAX_AGE: int = 1 # Seconds a reverse proxy may reuse a project read before revalidating, use TRAVEL_PROJ_CACHE_MAX_AGE
 
 
 class AppLoggerSettings(BaseSettings):
@@ -12,5 +15,87 @@ class AppLoggerSettings(BaseSettings):
     FILE_LEVEL: int = logging.DEBUG # Use LOG_FILE_LEVEL
     CONSOLE_LEVEL: int = logging.INFO # Use LOG_CONSOLE_LEVEL
 
+    ASYNC: bool = True # Queue records to a background thread and one shared file, use LOG_ASYNC
+    SHARED_FILE: str = "app.log" # File of the async mode, use LOG_SHARED_FILE
+    QUEUE_SIZE: int = 10_000 # Records are dropped when the queue is full, use LOG_QUEUE_SIZE
+    RATE_LIMIT: float = 0 # Max DEBUG/INFO records per second per logger, 0 = unlimited, use LOG_RATE_LIMIT
+    SAMPLE_RATE: float = 1.0 # Share of DEBUG/INFO records kept, use LOG_SAMPLE_RATE
+
+
+class ArticFetcherSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="ARTIC_", extra="ignore")
+
+    BASE_URL: str = "https://api.artic.edu/api/v1/places" # Use ARTIC_BASE_URL
+    NORMALIZED_MATCH: bool = False # Case- and whitespace-insensitive name lookup, use ARTIC_NORMALIZED_MATCH
+
+    SNAPSHOT_ENABLED: bool = True # Use ARTIC_SNAPSHOT_ENABLED
+    SNAPSHOT_PATH: str = "cache/artic_places.snapshot" # Use ARTIC_SNAPSHOT_PATH
+    SNAPSHOT_MAX_AGE: int = 24 * 60 * 60 # Seconds before a refetch is forced, use ARTIC_SNAPSHOT_MAX_AGE
+
+    PAGE_LIMIT: int = 100 # Places per page, use ARTIC_PAGE_LIMIT
+    FETCH_CONCURRENCY: int = 8 # Max pages in flight, use ARTIC_FETCH_CONCURRENCY
+    MAX_CONNECTIONS: int = 10 # Use ARTIC_MAX_CONNECTIONS
+    MAX_KEEPALIVE_CONNECTIONS: int = 5 # Use ARTIC_MAX_KEEPALIVE_CONNECTIONS
+    REQUEST_TIMEOUT: float = 60.0 # Seconds, use ARTIC_REQUEST_TIMEOUT
+    MAX_RETRIES: int = 4 # Retries per page on 429/5xx/network errors, use ARTIC_MAX_RETRIES
+    BACKOFF_BASE: float = 0.5 # Seconds, use ARTIC_BACKOFF_BASE
+    BACKOFF_MAX: float = 30.0 # Seconds, use ARTIC_BACKOFF_MAX
+
+    REFRESH_INTERVAL: float = 0 # Seconds between background refreshes, 0 disables, use ARTIC_REFRESH_INTERVAL
+    READY_TIMEOUT: float = 10.0 # Seconds a place-validating request waits for the initial load before a 503, use ARTIC_READY_TIMEOUT
+    STARTUP_RETRY_INTERVAL: float = 30.0 # Seconds between initial load attempts while the catalog is empty, use ARTIC_STARTUP_RETRY_INTERVAL
+
+    REMOTE_LOOKUP_ENABLED: bool = True # Ask the Artic search API on a cache miss, use ARTIC_REMOTE_LOOKUP_ENABLED
+    REMOTE_LOOKUP_LIMIT: int = 10 # Search results inspected per lookup, use ARTIC_REMOTE_LOOKUP_LIMIT
+    NEGATIVE_CACHE_SIZE: int = 1024 # Use ARTIC_NEGATIVE_CACHE_SIZE
+    NEGATIVE_CACHE_TTL: float = 300.0 # Seconds a confirmed miss is remembered, use ARTIC_NEGATIVE_CACHE_TTL
+
+class DatabaseSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="TRAVEL_DB_", extra="ignore")
+
+    BACKEND: str = "memory" # "memory", "sqlite" or "journal", use TRAVEL_DB_BACKEND
+    SQLITE_PATH: str = "data/travel_planner.db" # Use TRAVEL_DB_SQLITE_PATH
+    FLUSH_INTERVAL: float = 1.0 # Seconds between write-behind flushes, use TRAVEL_DB_FLUSH_INTERVAL
+    FLUSH_BATCH_SIZE: int = 500 # Pending rows that trigger an early flush, use TRAVEL_DB_FLUSH_BATCH_SIZE
+    SHARED: bool = False # Write-through SQLite store shared by uvicorn --workers processes, use TRAVEL_DB_SHARED
+
+    JOURNAL_DIR: str = "data/journal" # Use TRAVEL_DB_JOURNAL_DIR
+    JOURNAL_COMMIT_INTERVAL: float = 0.01 # Seconds mutations are gathered per fsync, use TRAVEL_DB_JOURNAL_COMMIT_INTERVAL
+    SNAPSHOT_EVERY: int = 10_000 # Journal entries between snapshots, 0 disables, use TRAVEL_DB_SNAPSHOT_EVERY
+
+class MetricsSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="METRICS_", extra="ignore")
+
+    ENABLED: bool = True # Serve /metrics and time every request, use METRICS_ENABLED
+    LOOP_LAG_INTERVAL: float = 0.5 # Seconds between event loop lag probes, 0 disables, use METRICS_LOOP_LAG_INTERVAL
+
+class ProfilingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="PROFILE_", extra="ignore")
+
+    ENABLED: bool = False # Profile a SAMPLE_RATE share of all requests, use PROFILE_ENABLED
+    SAMPLE_RATE: float = 0.01 # Use PROFILE_SAMPLE_RATE
+    HEADER_ENABLED: bool = False # Profile single requests sent with the X-Profile header, use PROFILE_HEADER_ENABLED
+    HEADER_TOKEN: str = "" # When set, X-Profile must carry this value, use PROFILE_HEADER_TOKEN
+    MODE: str = "deterministic" # "deterministic" (cProfile) or "sampling" (stack sampler), use PROFILE_MODE
+    SAMPLING_INTERVAL: float = 0.001 # Seconds between stack samples, use PROFILE_SAMPLING_INTERVAL
+    OUTPUT_DIR: str = "profiles" # Use PROFILE_OUTPUT_DIR
+
+class AdmissionSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="ADMISSION_", extra="ignore")
+
+    ENABLED: bool = True # Use ADMISSION_ENABLED
+    MAX_IN_FLIGHT: int = 256 # Requests served at once per worker, 0 = unlimited, use ADMISSION_MAX_IN_FLIGHT
+    PROJECTS_MAX_IN_FLIGHT: int = 128 # Project routes, 0 = only the global limit, use ADMISSION_PROJECTS_MAX_IN_FLIGHT
+    PLACES_MAX_IN_FLIGHT: int = 128 # Place routes, 0 = only the global limit, use ADMISSION_PLACES_MAX_IN_FLIGHT
+    QUEUE_SIZE: int = 512 # Requests waiting for a slot per limit, more are shed at once, use ADMISSION_QUEUE_SIZE
+    QUEUE_TIMEOUT: float = 1.0 # Seconds a request may wait for its slots before it is shed, use ADMISSION_QUEUE_TIMEOUT
+    RETRY_AFTER: int = 1 # Seconds sent in Retry-After of a shed request, use ADMISSION_RETRY_AFTER
+    EXEMPT_PATHS: list[str] = ["/health", "/metrics"] # Path prefixes never queued or shed, use ADMISSION_EXEMPT_PATHS (JSON list)
+
 travel_project_settings = AuctionSettings()
-app_logger_settings = AppLoggerSettings()
\ No newline at end of file
+app_logger_settings = AppLoggerSettings()
+artic_fetcher_settings = ArticFetcherSettings()
+database_settings = DatabaseSettings()
+metrics_settings = MetricsSettings()
+profiling_settings = ProfilingSettings()
+admission_settings = AdmissionSettings()
\ No newline at end of file
@@ -0,0 +1,50 @@
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # No flock on Windows, multi-worker mode is POSIX only and the lock is a no-op there
+    fcntl = None
+
+
+class FileLock:
+    """
+    Advisory inter-process lock (flock) on a lock file next to a shared resource.
+    The OS releases it when the holder exits, so a crashed worker can't leave it stuck.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._fd: int | None = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is None:
+            self._fd = fd
+            return True
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
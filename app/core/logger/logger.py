@@ -1,40 +1,183 @@
+import atexit
 import logging
+import queue
+import random
 import sys
+import threading
+import time
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from app.core.config.config import app_logger_settings
 
+
+class RateLimitFilter(logging.Filter):
+    """
+    Sampling and token-bucket rate limit for one logger's high-volume records.
+    WARNING and above always pass, DEBUG/INFO are sampled with sample_rate
+    and then limited to rate_limit records per second (0 = unlimited).
+    """
+
+    def __init__(self, rate_limit: float = 0, sample_rate: float = 1.0):
+        super().__init__()
+        self.rate_limit = rate_limit
+        self.sample_rate = sample_rate
+        self.dropped = 0
+
+        self._tokens = max(rate_limit, 1.0)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            self.dropped += 1
+            return False
+
+        if self.rate_limit <= 0:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            # Refill, a burst of up to one second worth of records is allowed
+            self._tokens = min(max(self.rate_limit, 1.0), self._tokens + (now - self._updated_at) * self.rate_limit)
+            self._updated_at = now
+
+            if self._tokens < 1.0:
+                self.dropped += 1
+                return False
+
+            self._tokens -= 1.0
+            return True
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Never blocks the caller: when the queue is full the record is dropped and counted."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener thread does the %-formatting, keep the record as is
+        return record
+
+
+class _QueueLogSink:
+    """
+    Process-wide sink of the async mode: every AppLogger puts records on one bounded
+    queue and a background listener thread writes them to stdout and a single
+    rotating file, so request handlers never wait on log I/O.
+    """
+    _lock = threading.Lock()
+    _handler: _DroppingQueueHandler | None = None
+    _listener: QueueListener | None = None
+
+    @classmethod
+    def get_handler(cls) -> _DroppingQueueHandler:
+        with cls._lock:
+            if cls._handler is None:
+                log_queue = queue.Queue(maxsize=app_logger_settings.QUEUE_SIZE)
+                cls._handler = _DroppingQueueHandler(log_queue)
+                cls._listener = QueueListener(
+                    log_queue,
+                    _console_handler(),
+                    _file_handler(app_logger_settings.SHARED_FILE),
+                    respect_handler_level=True,
+                )
+                cls._listener.start()
+                atexit.register(cls.stop)
+            return cls._handler
+
+    @classmethod
+    def stop(cls):
+        """Flushes the queue and stops the listener thread."""
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                for handler in cls._listener.handlers:
+                    handler.close()
+            cls._listener = None
+            cls._handler = None
+
+
+def _formatter() -> logging.Formatter:
+    return logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+
+def _console_handler() -> logging.Handler:
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(app_logger_settings.CONSOLE_LEVEL)
+    console_handler.setFormatter(_formatter())
+    return console_handler
+
+
+def _file_handler(log_file: str, level=app_logger_settings.FILE_LEVEL) -> logging.Handler:
+    # Create dir for files
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+
+    file_handler = RotatingFileHandler(
+        log_dir / log_file, maxBytes=5*1024*1024, backupCount=3
+    )
+    file_handler.setLevel(level)
+    file_handler.setFormatter(_formatter())
+    return file_handler
+
+
+def shutdown_logging():
+    """Writes out queued records, call on application shutdown."""
+    _QueueLogSink.stop()
+
+
 class AppLogger:
-    def __init__(self, name: str, log_file: str = "app.log", level = app_logger_settings.FILE_LEVEL):
-        # Create dir for files
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
+    def __init__(
+        self,
+        name: str,
+        log_file: str = "app.log",
+        level = app_logger_settings.FILE_LEVEL,
+        rate_limit: float | None = None,
+        sample_rate: float | None = None,
+    ):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
-        
+        if app_logger_settings.ASYNC:
+            # Records no sink would write are rejected before they are even created
+            self.logger.setLevel(min(app_logger_settings.FILE_LEVEL, app_logger_settings.CONSOLE_LEVEL))
+
         #Additional safety net for server reloads
         if self.logger.hasHandlers():
             self.logger.handlers.clear()
+        self.logger.filters.clear()
 
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        # Per-logger sampling / rate limit for DEBUG and INFO records
+        self.rate_filter = RateLimitFilter(
+            app_logger_settings.RATE_LIMIT if rate_limit is None else rate_limit,
+            app_logger_settings.SAMPLE_RATE if sample_rate is None else sample_rate,
         )
+        self.logger.addFilter(self.rate_filter)
+
+        if app_logger_settings.ASYNC:
+            # Shared queue -> listener thread -> console + one shared file
+            self.logger.addHandler(_QueueLogSink.get_handler())
+            self.logger.propagate = False
+            return
 
         # 1. Console
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(app_logger_settings.CONSOLE_LEVEL)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        self.logger.addHandler(_console_handler())
 
         # 2. File
-        file_handler = RotatingFileHandler(
-            log_dir / log_file, maxBytes=5*1024*1024, backupCount=3
-        )
-        file_handler.setLevel(app_logger_settings.FILE_LEVEL) 
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(_file_handler(log_file, level))
 
     def get_instance(self):
         return self.logger
@@ -0,0 +1,254 @@
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Seconds, request latencies from sub-millisecond cache hits to slow bulk imports
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """Returns the child for these label values, keep it around on hot paths."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values: Tuple[str, ...], child) -> List[str]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        # A lost increment under a thread race is acceptable for a counter, a lock per
+        # catalog lookup is not. The GIL keeps the float itself consistent.
+        self.value += amount
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        if not self.label_names:
+            self.labels()
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def _render_child(self, values, child: _CounterChild) -> List[str]:
+        return [f"{self.name}{_format_labels(self.label_names, values)} {_format_value(child.value)}"]
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Iterable[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        if not self.label_names:
+            self.labels()
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _render_child(self, values, child: _HistogramChild) -> List[str]:
+        with child._lock:
+            counts, total = list(child.counts), child.sum
+
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = 'le="' + _format_value(bound) + '"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, values, le)} {cumulative}")
+        labels = _format_labels(self.label_names, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauge(_Metric):
+    """
+    Read at scrape time from a callback, so keeping it current costs nothing on the request path.
+    The callback returns a number, or {label values: number} for a labeled gauge.
+    """
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], float | Dict[Tuple[str, ...], float]], label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._callback = callback
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        value = self._callback()
+        samples = value.items() if isinstance(value, dict) else [((), value)]
+        for values, sample in sorted(samples):
+            lines.append(f"{self.name}{_format_labels(self.label_names, values)} {_format_value(sample)}")
+        return lines
+
+
+class CallbackCounter(Gauge):
+    """A counter some other object already keeps, e.g. cache hits, read at scrape time."""
+    kind = "counter"
+
+
+class MetricsRegistry:
+    """
+    Process-wide metrics in the Prometheus text exposition format.
+    With uvicorn --workers every process has its own registry, scrape each worker.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(MetricsRegistry, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            # Module reloads and repeated singleton setup get the existing metric back
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def gauge(self, name: str, documentation: str, callback: Callable, label_names: Sequence[str] = ()) -> Gauge:
+        """Replaces an earlier gauge of the same name, its callback may point at a stale object."""
+        gauge = Gauge(name, documentation, callback, label_names)
+        with self._lock:
+            self._metrics[name] = gauge
+        return gauge
+
+    def callback_counter(self, name: str, documentation: str, callback: Callable, label_names: Sequence[str] = ()) -> CallbackCounter:
+        counter = CallbackCounter(name, documentation, callback, label_names)
+        with self._lock:
+            self._metrics[name] = counter
+        return counter
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class EventLoopLagMonitor:
+    """
+    Sleeps interval seconds in a loop and records how late it wakes up.
+    Lag means something is blocking the event loop: CPU-heavy handlers, sync I/O, lock waits.
+    """
+
+    def __init__(self, interval: float, registry: MetricsRegistry):
+        self.interval = interval
+        self.last_lag = 0.0
+        self._task: asyncio.Task | None = None
+        self._histogram = registry.histogram(
+            "event_loop_lag_seconds",
+            "Delay between the scheduled and the actual wake-up of a timer on the event loop.",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+        )
+        registry.gauge("event_loop_lag_last_seconds", "Event loop lag of the latest probe.", lambda: self.last_lag)
+
+    def start(self):
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.last_lag = max(0.0, time.perf_counter() - started - self.interval)
+            self._histogram.observe(self.last_lag)
+
+
+metrics_registry = MetricsRegistry()
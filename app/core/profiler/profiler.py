@@ -0,0 +1,75 @@
+import cProfile
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+
+class DeterministicProfiler:
+    """cProfile of the calling thread, written as a pstats file (python -m pstats, snakeviz)."""
+    suffix = ".prof"
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        self._profile.enable()
+
+    def stop(self):
+        self._profile.disable()
+
+    def dump(self, path: Path):
+        self._profile.dump_stats(path)
+
+
+class StackSampler:
+    """
+    Low-overhead statistical profiler: a background thread records the target thread's
+    stack every interval seconds. Written in the collapsed-stack format
+    ("outer;inner;leaf count" per line) that flamegraph.pl and speedscope read.
+    CPU-bound code only yields the GIL every sys.getswitchinterval() (5 ms), which
+    bounds the effective sampling rate.
+    """
+    suffix = ".collapsed"
+
+    def __init__(self, interval: float = 0.001, thread_id: int | None = None):
+        self.interval = interval
+        self._thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                return
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            self._stacks[";".join(reversed(stack))] += 1
+
+    def dump(self, path: Path):
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self._stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+def create_profiler(mode: str, sampling_interval: float) -> DeterministicProfiler | StackSampler:
+    """Raises ValueError for an unknown mode."""
+    if mode == "deterministic":
+        return DeterministicProfiler()
+    if mode == "sampling":
+        return StackSampler(sampling_interval)
+    raise ValueError(f"Unknown profiling mode '{mode}', use 'deterministic' or 'sampling'")
@@ -0,0 +1,32 @@
+from app.core.config.config import database_settings
+from app.database.repository.repository import ProjectRepository
+from app.database.memory.memory import InMemoryProjectRepository
+from app.database.sqlite.sqlite import SQLiteProjectRepository
+from app.database.journal.journal import JournalProjectRepository
+
+
+def create_project_repository() -> ProjectRepository:
+    """Backend selected by TRAVEL_DB_BACKEND."""
+    backend = database_settings.BACKEND.lower()
+
+    # Only SQLite can be opened by several worker processes at once
+    if database_settings.SHARED and backend != "sqlite":
+        raise ValueError(f"TRAVEL_DB_SHARED needs TRAVEL_DB_BACKEND=sqlite, got {database_settings.BACKEND}")
+
+    if backend == "memory":
+        return InMemoryProjectRepository()
+    if backend == "sqlite":
+        return SQLiteProjectRepository(
+            database_settings.SQLITE_PATH,
+            flush_interval=database_settings.FLUSH_INTERVAL,
+            flush_batch_size=database_settings.FLUSH_BATCH_SIZE,
+            shared=database_settings.SHARED,
+        )
+    if backend == "journal":
+        return JournalProjectRepository(
+            database_settings.JOURNAL_DIR,
+            commit_interval=database_settings.JOURNAL_COMMIT_INTERVAL,
+            snapshot_every=database_settings.SNAPSHOT_EVERY,
+        )
+
+    raise ValueError(f"Unknown TRAVEL_DB_BACKEND: {database_settings.BACKEND}")
@@ -0,0 +1,320 @@
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+from app.core.logger.logger import AppLogger
+from app.database.repository.repository import ProjectRepository
+from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.place.place import ProjectPlace
+
+JOURNAL_FILE = "journal.ndjson"
+SNAPSHOT_FILE = "snapshot.ndjson"
+
+# Queue items handled by the writer thread, in order
+_ENTRY = 0
+_SNAPSHOT = 1
+_FLUSH = 2
+_STOP = 3
+
+
+def _project_row(project: TravelProject) -> list:
+    start_date = project._start_date.isoformat() if project._start_date else None
+    return [project._id, project._name, project._description, start_date]
+
+
+def _place_row(project: TravelProject, place: ProjectPlace) -> list:
+    return [place._id, project._id, place._artic_id, place._name, place._note, place._visited]
+
+
+def _restore_project(row: list) -> TravelProject:
+    project_id, name, description, start_date = row
+    return TravelProject.restore(project_id, name, description, datetime.fromisoformat(start_date) if start_date else None)
+
+
+def _restore_place(row: list) -> ProjectPlace:
+    place_id, _, artic_id, name, note, visited = row
+    return ProjectPlace.restore(place_id, name, artic_id, note, visited)
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+class JournalProjectRepository(ProjectRepository):
+    """
+    Append-only NDJSON journal of every mutation plus periodic compacted snapshots.
+
+    Entries are [seq, op, row] lines. A writer thread appends whatever is queued
+    and fsyncs once per group (group commit), so API calls never wait on the disk.
+    Every snapshot_every entries the current state is written to a snapshot that
+    records the last seq it covers, and the journal is truncated. Startup reads the
+    snapshot and replays at most snapshot_every journal entries on top of it.
+
+    The writer thread keeps its own row copy of the store, updated from the entries
+    as it writes them, so a snapshot is whatever that copy holds when the writer
+    reaches the snapshot marker. The request path only queues the marker.
+    """
+    _logger = AppLogger("JOURNALREPOSITORY", "journal_repository.log")
+
+    def __init__(self, directory: str, commit_interval: float = 0.01, snapshot_every: int = 10_000):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._journal_path = self.directory / JOURNAL_FILE
+        self._snapshot_path = self.directory / SNAPSHOT_FILE
+        self._commit_interval = commit_interval
+        self._snapshot_every = snapshot_every
+
+        # project id -> [project row, {place id: place row}], the source of the snapshots.
+        # Filled by recovery, then owned by the writer thread
+        self._rows: Dict[int, list] = {}
+        self._counters: Tuple[int, int] | None = None
+        self._seq = 0
+        self._since_snapshot = 0
+        self._recover()
+
+        # seq is assigned and queued under one lock, so the journal is written in seq order
+        self._lock = threading.RLock()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Set once a write fails, later mutations and flushes raise it instead of waiting
+        self._failure: OSError | None = None
+        self._journal = open(self._journal_path, "ab")
+        self._writer = threading.Thread(target=self._write_loop, name="journal-writer", daemon=True)
+        self._writer.start()
+
+    # --- Recovery ---
+
+    def _recover(self):
+        started = time.perf_counter()
+        next_project_id, next_place_id = 0, 0
+
+        # 1. Latest snapshot
+        snapshot_seq = 0
+        if self._snapshot_path.exists():
+            with open(self._snapshot_path, "rb") as snapshot:
+                header = json.loads(snapshot.readline())
+                snapshot_seq = header["seq"]
+                next_project_id, next_place_id = header["next_project_id"], header["next_place_id"]
+                for line in snapshot:
+                    *project_row, places = json.loads(line)
+                    self._rows[project_row[0]] = [project_row, {row[0]: row for row in places}]
+
+        # 2. Journal tail, entries the snapshot already covers are skipped
+        replayed = 0
+        self._seq = snapshot_seq
+        if self._journal_path.exists():
+            with open(self._journal_path, "r+b") as journal:
+                good_length = 0
+                for line_number, line in enumerate(journal, 1):
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("no line end")
+                        seq, op, row = json.loads(line)
+                    except ValueError:
+                        # A torn last line is what a crash mid-write leaves behind. Cut it off,
+                        # entries appended after it would be unreadable on the next start
+                        self._logger.logger.warning("Journal %s ends with a broken entry at line %s", self._journal_path, line_number)
+                        journal.truncate(good_length)
+                        break
+                    good_length += len(line)
+                    if seq <= snapshot_seq:
+                        continue
+
+                    self._apply(op, row)
+                    if op == "project_created":
+                        next_project_id = max(next_project_id, row[0] + 1)
+                    elif op == "place_added":
+                        next_place_id = max(next_place_id, row[0] + 1)
+                    self._seq = seq
+                    replayed += 1
+
+        if self._seq:
+            self._counters = (next_project_id, next_place_id)
+        self._since_snapshot = replayed
+
+        self._logger.logger.info(
+            "Recovered %s projects from snapshot seq %s and %s journal entries in %.3fs",
+            len(self._rows), snapshot_seq, replayed, time.perf_counter() - started
+        )
+
+    def _apply(self, op: str, row: list):
+        """Applies one entry to the row copy, every entry carries the full new row."""
+        if op == "project_created":
+            self._rows[row[0]] = [row, {}]
+            return
+        if op == "project_removed":
+            self._rows.pop(row[0], None)
+            return
+
+        project = self._rows.get(row[0] if op == "project_updated" else row[1])
+        if project is None:
+            return
+
+        if op == "project_updated":
+            project[0] = row
+        elif op == "place_added":
+            project[1][row[0]] = row
+        elif op == "place_updated" and row[0] in project[1]:
+            project[1][row[0]] = row
+
+    def load_projects(self) -> Iterable[TravelProject]:
+        """Reads the row copy, so only at startup before the writer thread applies mutations."""
+        projects = []
+        for p_id in sorted(self._rows):
+            project_row, places = self._rows[p_id]
+            project = _restore_project(project_row)
+            project.attach_places(_restore_place(row) for row in places.values())
+            projects.append(project)
+        return projects
+
+    def load_place_owners(self) -> Iterable[Tuple[int, int]]:
+        return [(place_id, p_id) for p_id, (_, places) in self._rows.items() for place_id in places]
+
+    def load_id_counters(self) -> Tuple[int, int] | None:
+        return self._counters
+
+    # --- Journal ---
+
+    def project_created(self, project: TravelProject):
+        self._append("project_created", _project_row(project))
+
+    def project_updated(self, project: TravelProject):
+        self._append("project_updated", _project_row(project))
+
+    def project_removed(self, project_id: int):
+        self._append("project_removed", [project_id])
+
+    def place_added(self, project: TravelProject, place: ProjectPlace):
+        self._append("place_added", _place_row(project, place))
+
+    def place_updated(self, project: TravelProject, place: ProjectPlace):
+        self._append("place_updated", _place_row(project, place))
+
+    def _append(self, op: str, row: list):
+        self._raise_failure()
+        with self._lock:
+            self._seq += 1
+            self._queue.put((_ENTRY, (self._seq, op, row)))
+            self._since_snapshot += 1
+            if self._snapshot_every and self._since_snapshot >= self._snapshot_every:
+                self._queue_snapshot()
+
+    def _queue_snapshot(self):
+        """
+        Queues a snapshot at the current seq. Only the header is captured here,
+        the writer thread reaches the marker with its row copy at exactly this seq.
+        """
+        header = {
+            "seq": self._seq,
+            "next_project_id": TravelProject._ids.next_id,
+            "next_place_id": ProjectPlace._ids.next_id,
+        }
+        self._since_snapshot = 0
+        self._queue.put((_SNAPSHOT, header))
+
+    def _raise_failure(self):
+        if self._failure is not None:
+            raise OSError(f"Journal {self._journal_path} can't be written: {self._failure}") from self._failure
+
+    def _write_loop(self):
+        while True:
+            # 1. Wait for work, then give concurrent mutations a moment to join the group
+            items = [self._queue.get()]
+            if self._commit_interval:
+                time.sleep(self._commit_interval)
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                if self._write_group(items):
+                    return
+            except OSError as e:
+                # e.g. a full disk: fail the waiters and every later mutation instead of hanging them
+                self._logger.logger.error("Journal writer stopped: %s", e)
+                self._failure = e
+                self._drain(items)
+                return
+
+    def _write_group(self, items: list) -> bool:
+        """One write and one fsync for all entries of the group, True once stopped."""
+        lines: List[bytes] = []
+        for kind, payload in items:
+            if kind == _ENTRY:
+                lines.append(_dumps(payload).encode() + b"\n")
+                self._apply(*payload[1:])
+                continue
+
+            self._commit(lines)
+            lines = []
+            if kind == _SNAPSHOT:
+                self._write_snapshot(payload)
+            elif kind == _FLUSH:
+                payload.set()
+            elif kind == _STOP:
+                return True
+        self._commit(lines)
+        return False
+
+    def _drain(self, items: list):
+        """After a failure: releases flush waiters and drops entries until stopped."""
+        while True:
+            for kind, payload in items:
+                if kind == _FLUSH:
+                    payload.set()
+                elif kind == _STOP:
+                    return
+            items = [self._queue.get()]
+
+    def _commit(self, lines: List[bytes]):
+        if not lines:
+            return
+        self._journal.write(b"".join(lines))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def _write_snapshot(self, header: dict):
+        started = time.perf_counter()
+
+        # 1. Atomic replace, a crash leaves either the old or the new snapshot
+        tmp_path = self._snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as snapshot:
+            snapshot.write(_dumps(header).encode() + b"\n")
+            snapshot.writelines(
+                _dumps(project_row + [list(places.values())]).encode() + b"\n"
+                for project_row, places in self._rows.values()
+            )
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(tmp_path, self._snapshot_path)
+
+        # 2. Everything journaled so far is covered, entries after it come later in the queue
+        self._journal.truncate(0)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+        self._logger.logger.info(
+            "Wrote snapshot at seq %s with %s projects in %.3fs", header["seq"], len(self._rows), time.perf_counter() - started
+        )
+
+    def flush(self):
+        """Blocks until every queued entry is on disk, raises if the writer failed."""
+        self._raise_failure()
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+        self._raise_failure()
+
+    def close(self):
+        # A final snapshot makes the next startup replay nothing
+        with self._lock:
+            if self._snapshot_every and self._since_snapshot:
+                self._queue_snapshot()
+            self._queue.put((_STOP, None))
+        self._writer.join()
+        self._journal.close()
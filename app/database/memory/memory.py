@@ -0,0 +1,32 @@
+from typing import Iterable, Tuple
+from app.database.repository.repository import ProjectRepository
+from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.place.place import ProjectPlace
+
+
+class InMemoryProjectRepository(ProjectRepository):
+    """Default backend: nothing outlives the process, TravelManager's dicts are the store."""
+
+    def load_projects(self) -> Iterable[TravelProject]:
+        return ()
+
+    def load_place_owners(self) -> Iterable[Tuple[int, int]]:
+        return ()
+
+    def load_id_counters(self) -> Tuple[int, int] | None:
+        return None
+
+    def project_created(self, project: TravelProject):
+        pass
+
+    def project_updated(self, project: TravelProject):
+        pass
+
+    def project_removed(self, project_id: int):
+        pass
+
+    def place_added(self, project: TravelProject, place: ProjectPlace):
+        pass
+
+    def place_updated(self, project: TravelProject, place: ProjectPlace):
+        pass
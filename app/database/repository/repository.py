@@ -0,0 +1,81 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Tuple
+from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.place.place import ProjectPlace
+
+
+class ProjectRepository(ABC):
+    """
+    Persistence backend behind TravelManager. The manager keeps the working set in
+    memory and reports every mutation here; at startup it restores its state
+    from load_projects / load_place_owners / load_id_counters.
+    """
+
+    @abstractmethod
+    def load_projects(self) -> Iterable[TravelProject]:
+        """Stored projects, ascending by id. Their places may be loaded lazily."""
+
+    @abstractmethod
+    def load_place_owners(self) -> Iterable[Tuple[int, int]]:
+        """(place id, project id) of every stored place."""
+
+    @abstractmethod
+    def load_id_counters(self) -> Tuple[int, int] | None:
+        """Next (project id, place id) to hand out, None for an empty store."""
+
+    @abstractmethod
+    def project_created(self, project: TravelProject):
+        pass
+
+    @abstractmethod
+    def project_updated(self, project: TravelProject):
+        pass
+
+    @abstractmethod
+    def project_removed(self, project_id: int):
+        pass
+
+    @abstractmethod
+    def place_added(self, project: TravelProject, place: ProjectPlace):
+        pass
+
+    @abstractmethod
+    def place_updated(self, project: TravelProject, place: ProjectPlace):
+        """Covers both edits and marking the place visited."""
+
+    # --- Multi-worker hooks, single-process backends keep the defaults ---
+
+    # Opened by several worker processes, calls may then wait on the others
+    shared = False
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Wraps one manager mutation, a shared store runs it under its write lock."""
+        yield
+
+    def next_project_id(self) -> int | None:
+        """Id from a shared allocator, None lets TravelProject use its local counter."""
+        return None
+
+    def next_place_id(self) -> int | None:
+        """Id from a shared allocator, None lets ProjectPlace use its local counter."""
+        return None
+
+    def changed_projects(self) -> Iterable[int] | None:
+        """Ids of projects other processes changed since the last call, None if everything must be reloaded."""
+        return ()
+
+    def load_project(self, project_id: int) -> TravelProject | None:
+        """
+        Current stored state of one project, None if it was removed. Only asked for
+        projects changed_projects reported, which the default never does.
+        """
+        return None
+
+    def flush(self):
+        """Writes out anything still buffered."""
+
+    def close(self):
+        """Flushes and releases the backend."""
+        self.flush()
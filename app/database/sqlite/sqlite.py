@@ -0,0 +1,403 @@
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+from app.core.logger.logger import AppLogger
+from app.database.repository.repository import ProjectRepository
+from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.place.place import ProjectPlace
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id          INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL,
+    description TEXT,
+    start_date  TEXT
+);
+CREATE TABLE IF NOT EXISTS places (
+    id          INTEGER PRIMARY KEY,
+    project_id  INTEGER NOT NULL,
+    artic_id    INTEGER NOT NULL,
+    name        TEXT NOT NULL,
+    note        TEXT,
+    visited     INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS places_project_id ON places (project_id);
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id INTEGER NOT NULL,
+    origin     TEXT NOT NULL
+);
+"""
+# Shared mode: changes other workers haven't read within this many entries force a full reload
+CHANGE_LOG_SIZE = 100_000
+# Upper bound in seconds of the delay between retries of a failed write-behind flush
+FLUSH_RETRY_MAX_DELAY = 60.0
+
+# Constant parameterized statements, sqlite3 keeps them prepared in its statement cache
+_UPSERT_PROJECT = """
+INSERT INTO projects (id, name, description, start_date) VALUES (?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET name = excluded.name, description = excluded.description, start_date = excluded.start_date
+"""
+_UPSERT_PLACE = """
+INSERT INTO places (id, project_id, artic_id, name, note, visited) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET name = excluded.name, note = excluded.note, visited = excluded.visited
+"""
+_DELETE_PLACES = "DELETE FROM places WHERE project_id = ?"
+_DELETE_PROJECT = "DELETE FROM projects WHERE id = ?"
+_UPSERT_COUNTER = "INSERT INTO counters (name, value) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = excluded.value"
+_SELECT_PROJECTS = "SELECT id, name, description, start_date FROM projects ORDER BY id"
+_SELECT_PLACE_OWNERS = "SELECT id, project_id FROM places"
+_SELECT_PROJECT_PLACES = "SELECT id, artic_id, name, note, visited FROM places WHERE project_id = ? ORDER BY id"
+_SELECT_COUNTERS = "SELECT name, value FROM counters"
+_SELECT_PROJECT = "SELECT id, name, description, start_date FROM projects WHERE id = ?"
+_INIT_COUNTER = "INSERT OR IGNORE INTO counters (name, value) VALUES (?, ?)"
+_NEXT_ID = "UPDATE counters SET value = value + 1 WHERE name = ? RETURNING value - 1"
+_INSERT_CHANGE = "INSERT INTO changes (project_id, origin) VALUES (?, ?)"
+_SELECT_CHANGES = "SELECT seq, project_id, origin FROM changes WHERE seq > ? ORDER BY seq"
+_PRUNE_CHANGES = "DELETE FROM changes WHERE seq <= ?"
+
+ProjectRow = Tuple[int, str, str | None, str | None]
+PlaceRow = Tuple[int, int, int, str, str | None, int]
+
+
+class SQLiteProjectRepository(ProjectRepository):
+    """
+    SQLite backend in WAL mode with write-behind batching.
+    Mutations only record the latest row per id in memory; a background thread
+    writes them in one transaction every flush_interval seconds, or sooner once
+    flush_batch_size rows are pending. With WAL and synchronous=NORMAL a commit
+    doesn't fsync, so no API call waits on the disk.
+    Places of stored projects are read on first access to the project.
+
+    With shared=True the database is the store several worker processes agree on:
+    writes go straight through inside BEGIN IMMEDIATE transactions, ids come from
+    the counters table and every write logs its project in the changes table, which
+    other workers read back when PRAGMA data_version says someone else committed.
+    """
+    _logger = AppLogger("SQLITEREPOSITORY", "sqlite_repository.log")
+
+    def __init__(self, path: str, flush_interval: float = 1.0, flush_batch_size: int = 500, shared: bool = False):
+        self.path = path
+        self._flush_interval = flush_interval
+        self._flush_batch_size = flush_batch_size
+        self.shared = shared
+        # Per thread: another thread's open transaction must not let this one skip the lock
+        self._transaction_state = threading.local()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by the request path (lazy loads) and the flusher,
+        # reentrant because writes run inside transaction()
+        self._db_lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+        # Pending writes, the latest row per id wins
+        self._pending_lock = threading.Lock()
+        self._pending_projects: Dict[int, ProjectRow] = {}
+        self._pending_places: Dict[int, PlaceRow] = {}
+        self._pending_removals: Set[int] = set()
+
+        # Shared mode writes through, no flusher
+        if shared:
+            # Lazy loads get their own connection: with WAL they go on while a transaction
+            # holds _db_lock waiting for another worker's write lock
+            self._read_lock = threading.Lock()
+            self._read_connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+            self._init_shared()
+            self._logger.logger.info("Opened shared SQLite repository %s as %s", path, self._origin)
+            return
+
+        self._wake_up = threading.Event()
+        self._stopping = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="sqlite-write-behind", daemon=True)
+        self._flusher.start()
+
+        self._logger.logger.info("Opened SQLite repository %s", path)
+
+    def _init_shared(self):
+        self._origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        with self._db_lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            # Counters continue after existing rows, e.g. a store written in single-process mode
+            self._connection.execute(_INIT_COUNTER, ("project", self._max_id("projects") + 1))
+            self._connection.execute(_INIT_COUNTER, ("place", self._max_id("places") + 1))
+            self._last_change = self._connection.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+            self._connection.execute("COMMIT")
+            self._data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _max_id(self, table: str) -> int:
+        return self._connection.execute(f"SELECT COALESCE(MAX(id), -1) FROM {table}").fetchone()[0]
+
+    # --- Reads ---
+
+    def load_projects(self) -> Iterable[TravelProject]:
+        with self._db_lock:
+            rows = self._connection.execute(_SELECT_PROJECTS).fetchall()
+
+        for project_id, name, description, start_date in rows:
+            yield TravelProject.restore(
+                project_id,
+                name,
+                description,
+                datetime.fromisoformat(start_date) if start_date else None,
+                places_loader=self._load_places,
+            )
+
+    def load_place_owners(self) -> Iterable[Tuple[int, int]]:
+        with self._db_lock:
+            return self._connection.execute(_SELECT_PLACE_OWNERS).fetchall()
+
+    def load_id_counters(self) -> Tuple[int, int] | None:
+        with self._db_lock:
+            counters = dict(self._connection.execute(_SELECT_COUNTERS).fetchall())
+
+        if not counters:
+            return None
+        return counters.get("project", 0), counters.get("place", 0)
+
+    def load_project(self, project_id: int) -> TravelProject | None:
+        with self._db_lock:
+            row = self._connection.execute(_SELECT_PROJECT, (project_id,)).fetchone()
+
+        if row is None:
+            return None
+        project_id, name, description, start_date = row
+        return TravelProject.restore(
+            project_id,
+            name,
+            description,
+            datetime.fromisoformat(start_date) if start_date else None,
+            places_loader=self._load_places,
+        )
+
+    def _load_places(self, project: TravelProject) -> List[ProjectPlace]:
+        if self.shared:
+            with self._read_lock:
+                rows = self._read_connection.execute(_SELECT_PROJECT_PLACES, (project._id,)).fetchall()
+        else:
+            with self._db_lock:
+                rows = self._connection.execute(_SELECT_PROJECT_PLACES, (project._id,)).fetchall()
+
+        self._logger.logger.debug("Lazily loaded %s places of project %s", len(rows), project._id)
+        return [
+            ProjectPlace.restore(place_id, name, artic_id, note, bool(visited))
+            for place_id, artic_id, name, note, visited in rows
+        ]
+
+    # --- Shared mode ---
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # Nested scopes join the outer transaction
+        if not self.shared or self._in_transaction:
+            yield
+            return
+
+        with self._db_lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._transaction_state.active = True
+            try:
+                yield
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+            finally:
+                self._transaction_state.active = False
+
+    @property
+    def _in_transaction(self) -> bool:
+        """Whether the calling thread is inside transaction()."""
+        return getattr(self._transaction_state, "active", False)
+
+    def next_project_id(self) -> int | None:
+        return self._next_id("project") if self.shared else None
+
+    def next_place_id(self) -> int | None:
+        return self._next_id("place") if self.shared else None
+
+    def _next_id(self, name: str) -> int:
+        with self._db_lock:
+            # fetchall steps the RETURNING statement to completion
+            return self._connection.execute(_NEXT_ID, (name,)).fetchall()[0][0]
+
+    def changed_projects(self) -> Iterable[int] | None:
+        if not self.shared:
+            return ()
+
+        with self._db_lock:
+            # 1. Cheap check, data_version only moves when another connection commits
+            data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self._data_version:
+                return ()
+            self._data_version = data_version
+
+            # 2. What changed since the last read
+            rows = self._connection.execute(_SELECT_CHANGES, (self._last_change,)).fetchall()
+
+        if not rows:
+            return ()
+        # Pruned past our position, the log can't tell what we missed
+        missed = rows[0][0] > self._last_change + 1
+        self._last_change = rows[-1][0]
+        if missed:
+            self._logger.logger.warning("Change log was pruned past seq %s, reloading everything", rows[0][0] - 1)
+            return None
+
+        return list(dict.fromkeys(project_id for _, project_id, origin in rows if origin != self._origin))
+
+    def _write_through(self, project_id: int, statements: List[Tuple[str, tuple]]):
+        with self._db_lock:
+            own_transaction = not self._in_transaction
+            if own_transaction:
+                self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in statements:
+                    self._connection.execute(sql, params)
+                seq = self._connection.execute(_INSERT_CHANGE, (project_id, self._origin)).lastrowid
+                if seq % 1000 == 0:
+                    self._connection.execute(_PRUNE_CHANGES, (seq - CHANGE_LOG_SIZE,))
+            except BaseException:
+                if own_transaction:
+                    self._connection.execute("ROLLBACK")
+                raise
+            if own_transaction:
+                self._connection.execute("COMMIT")
+
+    # --- Writes, buffered ---
+
+    def project_created(self, project: TravelProject):
+        self._queue_project(project)
+
+    def project_updated(self, project: TravelProject):
+        self._queue_project(project)
+
+    def project_removed(self, project_id: int):
+        if self.shared:
+            self._write_through(project_id, [(_DELETE_PLACES, (project_id,)), (_DELETE_PROJECT, (project_id,))])
+            return
+
+        with self._pending_lock:
+            self._pending_projects.pop(project_id, None)
+            for place_id in [p_id for p_id, row in self._pending_places.items() if row[1] == project_id]:
+                del self._pending_places[place_id]
+            self._pending_removals.add(project_id)
+        self._maybe_wake_up()
+
+    def place_added(self, project: TravelProject, place: ProjectPlace):
+        self._queue_place(project, place)
+
+    def place_updated(self, project: TravelProject, place: ProjectPlace):
+        self._queue_place(project, place)
+
+    def _queue_project(self, project: TravelProject):
+        start_date = project._start_date.isoformat() if project._start_date else None
+        if self.shared:
+            self._write_through(project._id, [(_UPSERT_PROJECT, (project._id, project._name, project._description, start_date))])
+            return
+
+        with self._pending_lock:
+            self._pending_projects[project._id] = (project._id, project._name, project._description, start_date)
+        self._maybe_wake_up()
+
+    def _queue_place(self, project: TravelProject, place: ProjectPlace):
+        row = (place._id, project._id, place._artic_id, place._name, place._note, int(place._visited))
+        if self.shared:
+            self._write_through(project._id, [(_UPSERT_PLACE, row)])
+            return
+
+        with self._pending_lock:
+            self._pending_places[place._id] = row
+        self._maybe_wake_up()
+
+    def _pending_count(self) -> int:
+        return len(self._pending_projects) + len(self._pending_places) + len(self._pending_removals)
+
+    def _maybe_wake_up(self):
+        if self._pending_count() >= self._flush_batch_size:
+            self._wake_up.set()
+
+    # --- Flushing ---
+
+    def _flush_loop(self):
+        delay = self._flush_interval
+        while not self._stopping:
+            self._wake_up.wait(delay)
+            self._wake_up.clear()
+            try:
+                self.flush()
+                delay = self._flush_interval
+            except sqlite3.Error as e:
+                # The batch went back to the pending rows, retry later with backoff
+                delay = min(delay * 2, FLUSH_RETRY_MAX_DELAY)
+                self._logger.logger.error("Write-behind flush failed, retrying in %.1fs: %s", delay, e)
+
+    def flush(self):
+        # 1. Take the pending rows and counters, new writes go to fresh buffers
+        with self._pending_lock:
+            if not self._pending_count():
+                return
+            projects, self._pending_projects = self._pending_projects, {}
+            places, self._pending_places = self._pending_places, {}
+            removals, self._pending_removals = self._pending_removals, set()
+            counters = (("project", TravelProject._ids.next_id), ("place", ProjectPlace._ids.next_id))
+
+        # 2. One transaction for the whole batch
+        with self._db_lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN")
+            try:
+                cursor.executemany(_DELETE_PLACES, ((p_id,) for p_id in removals))
+                cursor.executemany(_DELETE_PROJECT, ((p_id,) for p_id in removals))
+                cursor.executemany(_UPSERT_PROJECT, projects.values())
+                cursor.executemany(_UPSERT_PLACE, places.values())
+                cursor.executemany(_UPSERT_COUNTER, counters)
+                cursor.execute("COMMIT")
+            except sqlite3.Error:
+                if self._connection.in_transaction:
+                    cursor.execute("ROLLBACK")
+                self._requeue(projects, places, removals)
+                raise
+
+        self._logger.logger.debug(
+            "Flushed %s projects, %s places, %s removals", len(projects), len(places), len(removals)
+        )
+
+    def _requeue(self, projects: Dict[int, ProjectRow], places: Dict[int, PlaceRow], removals: Set[int]):
+        """Puts a batch that failed to flush back, rows queued since then are newer and win."""
+        with self._pending_lock:
+            self._pending_removals |= removals
+            for project_id, row in projects.items():
+                if project_id not in self._pending_removals:
+                    self._pending_projects.setdefault(project_id, row)
+            for place_id, row in places.items():
+                if row[1] not in self._pending_removals:
+                    self._pending_places.setdefault(place_id, row)
+
+    def close(self):
+        if not self.shared:
+            self._stopping = True
+            self._wake_up.set()
+            self._flusher.join()
+            self.flush()
+
+        with self._db_lock:
+            self._connection.close()
+        if self.shared:
+            with self._read_lock:
+                self._read_connection.close()
+        self._logger.logger.info("Closed SQLite repository %s", self.path)
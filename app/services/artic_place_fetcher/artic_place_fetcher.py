@@ -1,11 +1,23 @@
 import asyncio
 import httpx
-from typing import Dict
-from app.services.artic_place_fetcher.models.models import ArticResponse
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Mapping, Tuple
+from app.services.artic_place_fetcher.models.models import ArticResponse, ArticSearchResponse, CatalogReadiness, CatalogRefreshInfo, CrawlReport
+from app.services.artic_place_fetcher.catalog.catalog import PlaceCatalog, normalize_name
+from app.services.artic_place_fetcher.negative_cache.negative_cache import NegativeCache
+from app.services.artic_place_fetcher.snapshot.snapshot import CatalogSnapshot
 from app.core.logger.logger import AppLogger
+from app.core.file_lock.file_lock import FileLock
+from app.core.metrics.metrics import metrics_registry
+from app.core.config.config import artic_fetcher_settings
 from app.services.artic_place_fetcher.errors.errors import *
 import random
 
+# Seconds between attempts to take the snapshot lock while another worker holds it
+SNAPSHOT_LOCK_POLL_INTERVAL = 0.1
+
 class ArticPlaceFetcher:
     _instance = None
     _logger = AppLogger("ARTICFETCHER", "artic_fetcher.log")
@@ -17,17 +29,81 @@ class ArticPlaceFetcher:
             cls._instance._initialized = False
         return cls._instance
     
-    #TODO get url from config
-    def __init__(self, base_url: str = "https://api.artic.edu/api/v1/places"):
+    def __init__(self, base_url: str = artic_fetcher_settings.BASE_URL):
         if self._initialized:
             return
         
-        self._logger.logger.info(f"Initialized artic fetcher with url : {base_url}")
+        self._logger.logger.info("Initialized artic fetcher with url : %s", base_url)
         self.base_url = base_url
-        self._places: Dict[int, str] = {}
+        self._catalog = PlaceCatalog()
+        self._snapshot = CatalogSnapshot(artic_fetcher_settings.SNAPSHOT_PATH)
+        # Serializes crawls across worker processes sharing the snapshot
+        self._snapshot_lock = FileLock(f"{artic_fetcher_settings.SNAPSHOT_PATH}.lock")
+        self._last_crawl_report = CrawlReport()
+        self._refresh_info = CatalogRefreshInfo()
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+        # Initial load in the background, requests needing the catalog wait for _ready
+        self._ready = asyncio.Event()
+        self._load_task: asyncio.Task | None = None
+        self._load_started_at: float | None = None
+        self._load_attempts = 0
+        # Report of the running crawl, updated page by page
+        self._crawl_progress: CrawlReport | None = None
+
+        # On-miss remote lookups
+        self._lookup_client: httpx.AsyncClient | None = None
+        self._inflight_lookups: Dict[str, asyncio.Future] = {}
+        self._negative_cache = NegativeCache(
+            artic_fetcher_settings.NEGATIVE_CACHE_SIZE,
+            artic_fetcher_settings.NEGATIVE_CACHE_TTL,
+        )
+        self._register_metrics()
 
         self._initialized = True
 
+    def _register_metrics(self):
+        self._page_fetch_seconds = metrics_registry.histogram(
+            "artic_page_fetch_duration_seconds",
+            "Duration of one Artic page request by outcome: ok, retry or error.",
+            ("outcome",),
+            buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+        )
+        self._page_fetch_failures = metrics_registry.counter(
+            "artic_page_fetch_failures_total",
+            "Failed Artic page requests: retried, or given_up once the retries are exhausted.",
+            ("result",),
+        )
+        lookups = metrics_registry.counter(
+            "artic_catalog_lookups_total", "Place name lookups in the cached catalog by result.", ("result",)
+        )
+        # Hot path, the children are resolved once
+        self._lookup_hits = lookups.labels("hit")
+        self._lookup_misses = lookups.labels("miss")
+        self._remote_lookups = metrics_registry.counter(
+            "artic_remote_lookups_total",
+            "Artic search API lookups after a catalog miss: found, not_found or error.",
+            ("result",),
+        )
+        metrics_registry.gauge("artic_catalog_places", "Places in the cached catalog.", lambda: len(self._catalog))
+        metrics_registry.gauge(
+            "artic_catalog_refresh_duration_seconds",
+            "Duration of the latest full crawl.",
+            lambda: self._refresh_info.last_duration or 0.0,
+        )
+        metrics_registry.gauge(
+            "artic_catalog_refreshing", "1 while a crawl is running.", lambda: int(self._refresh_lock.locked())
+        )
+        metrics_registry.gauge(
+            "artic_catalog_ready", "1 once the initial catalog load finished.", lambda: int(self.is_ready)
+        )
+
+    @property
+    def _places(self) -> Mapping[int, str]:
+        """Read-only id -> title view of the cached catalog."""
+        return self._catalog.places
+
     def get_random_place_name(self) -> str:
         """For debug purposes: returns a random place name from the cache."""
         if not self._places:
@@ -37,61 +113,559 @@ class ArticPlaceFetcher:
         # so we convert the dictionary values into a list first
         return random.choice(list(self._places.values()))
     
-    async def fetch_all_places(self, limit: int = 100) -> Dict[int, str]:
-        """Public method to orchestrate the full fetch."""
-        self._logger.logger.info(f"Trying to fetch all places")
-        async with httpx.AsyncClient() as client:
+    async def load_places(self, limit: int | None = None) -> Mapping[int, str]:
+        """
+        Startup entry point: loads the catalog from the on-disk snapshot when it is
+        younger than ARTIC_SNAPSHOT_MAX_AGE, otherwise crawls the Artic API and
+        rewrites the snapshot. Falls back to a stale snapshot if the crawl fails.
+        With several workers only the first one to take the snapshot lock crawls,
+        the others wait for it and then load the snapshot it wrote.
+        """
+        if not artic_fetcher_settings.SNAPSHOT_ENABLED:
+            return await self.fetch_all_places(limit)
+
+        await self._acquire_snapshot_lock()
+        try:
+            return await self._load_places_locked(limit)
+        finally:
+            self._snapshot_lock.release()
+
+    async def _acquire_snapshot_lock(self):
+        """
+        Polls the lock instead of a blocking acquire in a thread: that thread would go on
+        to take the lock after its waiter was cancelled, and nobody would release it.
+        """
+        while not self._snapshot_lock.acquire(blocking=False):
+            await asyncio.sleep(SNAPSHOT_LOCK_POLL_INTERVAL)
+
+    async def _load_places_locked(self, limit: int | None) -> Mapping[int, str]:
+        # 1. Fresh snapshot, no network needed
+        if self._load_snapshot(artic_fetcher_settings.SNAPSHOT_MAX_AGE):
+            return self._places
+
+        # 2. Missing or expired snapshot, crawl and persist the result
+        await self.fetch_all_places(limit)
+        if self._last_crawl_report.is_complete:
+            await self._save_snapshot()
+            return self._places
+
+        # 3. Partial or failed crawl, a stale catalog is better than gaps.
+        # Freshly crawled titles win, the snapshot only fills in missing ids.
+        self._logger.logger.warning("Artic crawl is incomplete, filling gaps from stale snapshot")
+        self._load_snapshot(max_age=None, overwrite=False)
+        return self._places
+
+    def _load_snapshot(self, max_age: float | None, overwrite: bool = True) -> bool:
+        """
+        Replaces the catalog with the snapshot, or only fills in its missing ids
+        with overwrite=False. Like fetch_all_places the new catalog is built off
+        to the side and swapped in with a single assignment.
+        Returns False if the snapshot is missing, expired or corrupt.
+        """
+        try:
+            places = self._snapshot.read(max_age)
+        except (OSError, ArticSnapshotError) as e:
+            self._logger.logger.error("Can't load snapshot: %s", e)
+            return False
+
+        if not places:
+            self._logger.logger.info("No usable snapshot at %s", self._snapshot.path)
+            return False
+
+        if overwrite:
+            # Ids dropped upstream since the last crawl go away with the old catalog
+            catalog = PlaceCatalog(places)
+        else:
+            places = {p_id: title for p_id, title in places.items() if p_id not in self._places}
+            catalog = PlaceCatalog(self._places)
+            catalog.update(places)
+
+        self._catalog = catalog
+        if overwrite:
+            age = self._snapshot.age() or 0.0
+            self._refresh_info = CatalogRefreshInfo(
+                last_refresh_at=datetime.now(timezone.utc) - timedelta(seconds=age),
+                entry_count=len(self._catalog),
+            )
+        self._mark_ready()
+        self._logger.logger.info("Loaded %s places from snapshot %s", len(places), self._snapshot.path)
+        return True
+
+    async def _save_snapshot(self):
+        places = dict(self._places)
+        try:
+            await asyncio.to_thread(self._snapshot.write, places)
+            self._logger.logger.info("Saved %s places to snapshot %s", len(places), self._snapshot.path)
+        except OSError as e:
+            self._logger.logger.error("Can't write snapshot %s: %s", self._snapshot.path, e)
+
+    @property
+    def last_crawl_report(self) -> CrawlReport:
+        """Completeness report of the most recent crawl."""
+        return self._last_crawl_report
+
+    @property
+    def refresh_info(self) -> CatalogRefreshInfo:
+        """Last refresh time, duration and entry count of the live catalog."""
+        return self._refresh_info.model_copy(update={
+            "entry_count": len(self._catalog),
+            "refreshing": self._refresh_lock.locked(),
+            "background_refresh": self._refresh_task is not None and not self._refresh_task.done(),
+        })
+
+    async def fetch_all_places(self, limit: int | None = None) -> Mapping[int, str]:
+        """
+        Public method to orchestrate the full fetch.
+        The new catalog and its indexes are built off to the side and swapped in
+        with a single assignment, lookups keep using the old one until then.
+        """
+        async with self._refresh_lock:
+            self._logger.logger.info("Trying to fetch all places")
+            catalog = PlaceCatalog()
+            report = await self._crawl(catalog, limit or artic_fetcher_settings.PAGE_LIMIT)
+            self._last_crawl_report = report
+
+            if report.is_complete:
+                self._logger.logger.info("All %s pages fetched in %.2fs", report.total_pages, report.duration)
+            else:
+                self._logger.logger.error(
+                    "Crawl incomplete: %s of %s pages missing %s",
+                    len(report.missing_pages), report.total_pages or "?", report.missing_pages,
+                )
+                # Stale-while-revalidate: keep serving the places the missing pages would have covered
+                catalog.update({p_id: title for p_id, title in self._places.items() if p_id not in catalog.places})
+
+            self._catalog = catalog
+            self._refresh_info = CatalogRefreshInfo(
+                last_refresh_at=datetime.now(timezone.utc),
+                last_duration=report.duration,
+                entry_count=len(catalog),
+                last_report=report,
+            )
+            self._mark_ready()
+
+        return self._places
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    @property
+    def readiness(self) -> CatalogReadiness:
+        """Whether the catalog can serve lookups, and how far its initial load got."""
+        loading = self._load_task is not None and not self._load_task.done()
+        elapsed = None if self._load_started_at is None else time.monotonic() - self._load_started_at
+        return CatalogReadiness(
+            ready=self.is_ready,
+            entry_count=len(self._catalog),
+            loading=loading,
+            load_attempts=self._load_attempts,
+            load_elapsed=elapsed,
+            crawl_progress=self._crawl_progress.model_copy() if self._crawl_progress else None,
+        )
+
+    def _mark_ready(self):
+        # An empty catalog after a failed crawl isn't ready, an upstream that really has no places is
+        if not self._ready.is_set() and (len(self._catalog) or self._last_crawl_report.is_complete):
+            self._ready.set()
+
+    def start_loading(self, retry_interval: float | None = None):
+        """
+        Loads the catalog in the background so the app can serve right away.
+        Attempts are repeated every retry_interval seconds while the catalog stays empty,
+        the background refresh starts once it is ready.
+        """
+        if retry_interval is None:
+            retry_interval = artic_fetcher_settings.STARTUP_RETRY_INTERVAL
+
+        if self._load_task is not None and not self._load_task.done():
+            self._logger.logger.warning("Catalog load is already running")
+            return
+
+        self._load_task = asyncio.create_task(self._load_until_ready(retry_interval))
+
+    async def stop_loading(self):
+        if self._load_task is None:
+            return
+
+        self._load_task.cancel()
+        try:
+            await self._load_task
+        except asyncio.CancelledError:
+            pass
+        self._load_task = None
+
+    async def _load_until_ready(self, retry_interval: float):
+        self._load_started_at = time.monotonic()
+        while True:
+            self._load_attempts += 1
+            try:
+                await self.load_places()
+            except Exception as e:
+                self._logger.logger.error("Catalog load attempt %s failed: %s", self._load_attempts, e)
+
+            if self.is_ready:
+                break
+            self._logger.logger.warning(
+                "Catalog is still empty after attempt %s, retrying in %ss", self._load_attempts, retry_interval
+            )
+            await asyncio.sleep(retry_interval)
+
+        self._logger.logger.info(
+            "Catalog ready with %s places after %.2fs", len(self._catalog), time.monotonic() - self._load_started_at
+        )
+        self.start_background_refresh()
+
+    async def wait_until_ready(self, timeout: float | None = None):
+        """
+        Returns once the catalog is loaded, waiting at most timeout seconds
+        (ARTIC_READY_TIMEOUT by default). Raises CatalogNotReadyError after that.
+        """
+        if self._ready.is_set():
+            return
+
+        if timeout is None:
+            timeout = artic_fetcher_settings.READY_TIMEOUT
+
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise CatalogNotReadyError(timeout)
+
+    def start_background_refresh(self, interval: float | None = None):
+        """
+        Starts refreshing the catalog every interval seconds (ARTIC_REFRESH_INTERVAL by default).
+        A non-positive interval leaves background refresh disabled.
+        """
+        if interval is None:
+            interval = artic_fetcher_settings.REFRESH_INTERVAL
+
+        if interval <= 0:
+            self._logger.logger.info("Background catalog refresh is disabled")
+            return
+
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._logger.logger.warning("Background catalog refresh is already running")
+            return
+
+        self._logger.logger.info("Starting background catalog refresh every %ss", interval)
+        self._refresh_task = asyncio.create_task(self._refresh_loop(interval))
+
+    async def stop_background_refresh(self):
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+        self._logger.logger.info("Stopped background catalog refresh")
+
+    async def _refresh_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if artic_fetcher_settings.SNAPSHOT_ENABLED:
+                    await self._refresh_shared(interval)
+                else:
+                    await self.fetch_all_places()
+            except Exception as e:
+                # Keep the loop alive, the current catalog stays in service
+                self._logger.logger.error("Background catalog refresh failed: %s", e)
+
+    async def _refresh_shared(self, interval: float):
+        """One refresh per interval across all workers, the rest pick up the rewritten snapshot."""
+        await self._acquire_snapshot_lock()
+        try:
+            # Another worker refreshed during this period, reuse its crawl
+            if self._load_snapshot(max_age=interval / 2):
+                return
+
+            await self.fetch_all_places()
+            if self._last_crawl_report.is_complete:
+                await self._save_snapshot()
+        finally:
+            self._snapshot_lock.release()
+
+    async def _crawl(self, catalog: PlaceCatalog, limit: int) -> CrawlReport:
+        """
+        Fetches every page with at most ARTIC_FETCH_CONCURRENCY requests in flight,
+        merging each page into the catalog as soon as it arrives.
+        """
+        started = time.perf_counter()
+        report = CrawlReport()
+        self._crawl_progress = report
+        semaphore = asyncio.Semaphore(artic_fetcher_settings.FETCH_CONCURRENCY)
+        limits = httpx.Limits(
+            max_connections=artic_fetcher_settings.MAX_CONNECTIONS,
+            max_keepalive_connections=artic_fetcher_settings.MAX_KEEPALIVE_CONNECTIONS,
+        )
+
+        async with httpx.AsyncClient(limits=limits, timeout=artic_fetcher_settings.REQUEST_TIMEOUT) as client:
             # 1. Fetch the first page to get total_pages info
-            first_page_url = f"{self.base_url}?limit={limit}&page=1"
-            first_data = await self._fetch_single_page(client, first_page_url)
-            
-            if not first_data:
-                self._logger.logger.error(f"Can't fetch first page, url = {first_page_url}")
-                return {}
-
-            total_pages = first_data.pagination.total_pages
-            self._logger.logger.info(f"Fetched first page successfully")
-            
-            # 2. Create tasks for all remaining pages
-            tasks = []
-            for page in range(2, total_pages + 1):
-                url = f"{self.base_url}?limit={limit}&page={page}"
-                self._logger.logger.info(f"Fetching page {page}")
-                tasks.append(self._fetch_single_page(client, url))
-            
-            # 3. Wait for all pages to finish concurrently
-            results = await asyncio.gather(*tasks)
-            self._logger.logger.info(f"All pages fetched!")
-
-            
-            # 4. Merge results (skipping None if a page failed)
-            for page_data in [first_data] + list(results):
-                if page_data:
-                    self._places.update({p.id: p.title for p in page_data.data})
+            try:
+                first_data = await self._fetch_single_page(client, semaphore, 1, limit)
+            except ArticPageFetchError as e:
+                self._logger.logger.error("Can't fetch first page: %s", e)
+                report.missing_pages = [1]
+                report.duration = time.perf_counter() - started
+                return report
+
+            report.total_pages = first_data.pagination.total_pages
+            self._merge_page(catalog, first_data, report)
+
+            # 2. Remaining pages, the semaphore bounds how many run at once
+            tasks = [
+                asyncio.create_task(self._fetch_single_page(client, semaphore, page, limit))
+                for page in range(2, report.total_pages + 1)
+            ]
+
+            # 3. Merge in completion order instead of waiting for the slowest page
+            try:
+                for next_page in asyncio.as_completed(tasks):
+                    try:
+                        self._merge_page(catalog, await next_page, report)
+                    except ArticPageFetchError as e:
+                        self._logger.logger.error(str(e))
+                        report.missing_pages.append(e.page)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        report.missing_pages.sort()
+        report.duration = time.perf_counter() - started
+        return report
+
+    def _merge_page(self, catalog: PlaceCatalog, page_data: ArticResponse, report: CrawlReport):
+        catalog.update({p.id: p.title for p in page_data.data})
+        report.fetched_pages += 1
+        report.entries += len(page_data.data)
+
+    async def _fetch_single_page(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, page: int, limit: int
+    ) -> ArticResponse:
+        """
+        Private helper to fetch and parse a single page.
+        Retries transport errors, 429 and 5xx with exponential backoff and full jitter,
+        waiting for Retry-After instead when the server sends it, capped at ARTIC_BACKOFF_MAX.
+        Raises ArticPageFetchError once the retries are exhausted.
+        """
+        url = f"{self.base_url}?limit={limit}&page={page}"
+        max_retries = artic_fetcher_settings.MAX_RETRIES
+
+        for attempt in range(max_retries + 1):
+            retry_after = None
+            try:
+                # Only the request holds a slot, backoff sleeps don't block other pages
+                async with semaphore:
+                    self._logger.logger.debug("Fetching page %s (attempt %s)", page, attempt + 1)
+                    started = time.perf_counter()
+                    response = await client.get(url)
+
+                if response.status_code == 429 or response.status_code >= 500:
+                    reason = f"HTTP {response.status_code}"
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
                 else:
-                    self._logger.logger.warning(f"Page data is empty!")
-                    
-        return self._places
+                    response.raise_for_status()
+                    page_data = ArticResponse(**response.json())
+                    self._page_fetch_seconds.labels("ok").observe(time.perf_counter() - started)
+                    return page_data
+            except httpx.TransportError as e:
+                reason = f"{type(e).__name__}: {e}"
+            except (httpx.HTTPStatusError, ValueError) as e:
+                # Other 4xx and malformed payloads won't get better with a retry
+                self._page_fetch_seconds.labels("error").observe(time.perf_counter() - started)
+                self._page_fetch_failures.labels("given_up").inc()
+                raise ArticPageFetchError(page, str(e))
+
+            if attempt == max_retries:
+                self._page_fetch_seconds.labels("error").observe(time.perf_counter() - started)
+                self._page_fetch_failures.labels("given_up").inc()
+                raise ArticPageFetchError(page, f"{reason} after {attempt + 1} attempts")
+
+            self._page_fetch_seconds.labels("retry").observe(time.perf_counter() - started)
+            self._page_fetch_failures.labels("retried").inc()
+
+            if retry_after is not None:
+                # A huge or hostile Retry-After must not stall the crawl and readiness
+                delay = min(retry_after, artic_fetcher_settings.BACKOFF_MAX)
+            else:
+                delay = self._backoff_delay(attempt)
+            self._logger.logger.warning("Page %s failed (%s), retrying in %.2fs", page, reason, delay)
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        ceiling = min(
+            artic_fetcher_settings.BACKOFF_MAX,
+            artic_fetcher_settings.BACKOFF_BASE * 2 ** attempt,
+        )
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        """Retry-After is either delay seconds or an HTTP date."""
+        if not value:
+            return None
 
-    async def _fetch_single_page(self, client: httpx.AsyncClient, url: str) -> ArticResponse | None:
-        """Private helper to fetch and parse a single page."""
         try:
-            response = await client.get(url, timeout=60.0)
-            response.raise_for_status()
-            return ArticResponse(**response.json())
-        except Exception as e:
-            self._logger.logger.error(f"Error fetching {url}: {e}")
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
             return None
 
-    def get_place_id(self, name: str) -> int | None:
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get_place_id(self, name: str, normalized: bool | None = None) -> int | None:
         """
-        Returns the first ID found matching the given name.
+        Returns the lowest artic ID matching the given name.
+        With normalized=True the match ignores case and extra whitespace,
+        defaults to ARTIC_NORMALIZED_MATCH.
         Returns None if no match is found.
         """
-        for p_id, p_name in self._places.items(): 
-            if p_name == name:
-                return p_id
+        if normalized is None:
+            normalized = artic_fetcher_settings.NORMALIZED_MATCH
+
+        return self._lookup_catalog(name, normalized)
+
+    def _lookup_catalog(self, name: str, normalized: bool) -> int | None:
+        """Catalog lookup counted as a hit or a miss in /metrics."""
+        artic_id = self._catalog.get_id(name, normalized)
+        (self._lookup_misses if artic_id is None else self._lookup_hits).inc()
+        return artic_id
+
+    def get_place_ids(self, name: str, normalized: bool | None = None) -> List[int]:
+        """Returns all artic IDs matching the given name, lowest first."""
+        if normalized is None:
+            normalized = artic_fetcher_settings.NORMALIZED_MATCH
+
+        return self._catalog.get_ids(name, normalized)
+
+    async def resolve_place_id(self, name: str, normalized: bool | None = None) -> int | None:
+        """
+        Async lookup used by the request path: answers from the cached catalog and,
+        on a miss, asks the Artic search API once. Concurrent lookups of the same
+        name share one request, hits are added to the catalog and confirmed misses
+        are remembered for ARTIC_NEGATIVE_CACHE_TTL seconds.
+        Returns None if the place doesn't exist, raises ArticUpstreamError
+        if the Artic API couldn't tell.
+        """
+        if normalized is None:
+            normalized = artic_fetcher_settings.NORMALIZED_MATCH
+
+        await self.wait_until_ready()
+        artic_id = self._lookup_catalog(name, normalized)
+        if artic_id is not None or not artic_fetcher_settings.REMOTE_LOOKUP_ENABLED:
+            return artic_id
+
+        key = normalize_name(name) if normalized else name
+        if key in self._negative_cache:
+            return None
+
+        # Single-flight: the first caller starts the request, the others await the same future
+        lookup = self._inflight_lookups.get(key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self._lookup_remote(name, normalized))
+            self._inflight_lookups[key] = lookup
+            lookup.add_done_callback(lambda _: self._inflight_lookups.pop(key, None))
+
+        # Shielded so one cancelled request doesn't cancel the lookup for everyone else
+        return await asyncio.shield(lookup)
+
+    async def resolve_place_ids(
+        self, names: Iterable[str], normalized: bool | None = None
+    ) -> Dict[str, int | ArticUpstreamError | None]:
+        """
+        Batch form of resolve_place_id for bulk imports. Each distinct name is looked up
+        once, catalog hits are answered right away and only the misses go to the remote
+        lookup, at most ARTIC_FETCH_CONCURRENCY at a time. A name the Artic API couldn't
+        answer maps to its ArticUpstreamError, the other names still resolve.
+        """
+        if normalized is None:
+            normalized = artic_fetcher_settings.NORMALIZED_MATCH
+
+        # Projects without places don't need the catalog
+        names = list(dict.fromkeys(names))
+        if names:
+            await self.wait_until_ready()
+
+        # 1. Catalog pass
+        resolved: Dict[str, int | ArticUpstreamError | None] = {}
+        misses: List[str] = []
+        for name in names:
+            artic_id = self._lookup_catalog(name, normalized)
+            resolved[name] = artic_id
+            if artic_id is None:
+                misses.append(name)
+
+        if not misses or not artic_fetcher_settings.REMOTE_LOOKUP_ENABLED:
+            return resolved
+
+        # 2. Remote lookups of the misses, bounded
+        semaphore = asyncio.Semaphore(artic_fetcher_settings.FETCH_CONCURRENCY)
+
+        async def resolve(name: str) -> int | None:
+            async with semaphore:
+                return await self.resolve_place_id(name, normalized)
+
+        lookups = await asyncio.gather(*(resolve(name) for name in misses), return_exceptions=True)
+        for name, artic_id in zip(misses, lookups):
+            # Only upstream failures are per name, anything else is a bug
+            if isinstance(artic_id, BaseException) and not isinstance(artic_id, ArticUpstreamError):
+                raise artic_id
+            resolved[name] = artic_id
+        return resolved
+
+    async def _lookup_remote(self, name: str, normalized: bool) -> int | None:
+        key = normalize_name(name) if normalized else name
+        self._logger.logger.info("Place '%s' is not cached, asking Artic search API", name)
+
+        try:
+            if self._lookup_client is None:
+                self._lookup_client = httpx.AsyncClient(timeout=artic_fetcher_settings.REQUEST_TIMEOUT)
+
+            response = await self._lookup_client.get(
+                f"{self.base_url}/search",
+                params={"q": name, "fields": "id,title", "limit": artic_fetcher_settings.REMOTE_LOOKUP_LIMIT},
+            )
+            response.raise_for_status()
+            results = ArticSearchResponse(**response.json()).data
+        except (httpx.HTTPError, ValueError) as e:
+            # Upstream trouble isn't a confirmed miss, don't cache it
+            self._logger.logger.error("Remote lookup for '%s' failed: %s", name, e)
+            self._remote_lookups.labels("error").inc()
+            reason = f"HTTP {e.response.status_code}" if isinstance(e, httpx.HTTPStatusError) else type(e).__name__
+            raise ArticUpstreamError(name, reason)
+
+        matches = [p for p in results if (normalize_name(p.title) if normalized else p.title) == key]
+        if not matches:
+            self._logger.logger.info("Place '%s' doesn't exist upstream", name)
+            self._negative_cache.add(key)
+            self._remote_lookups.labels("not_found").inc()
+            return None
+
+        for place in matches:
+            self._catalog.add(place.id, place.title)
+        self._logger.logger.info("Cached %s place(s) found upstream for '%s'", len(matches), name)
+        self._remote_lookups.labels("found").inc()
+
+        return self._catalog.get_id(name, normalized)
+
+    async def aclose(self):
+        """Closes the connection pool used by remote lookups."""
+        if self._lookup_client is not None:
+            await self._lookup_client.aclose()
+            self._lookup_client = None
 
-        return None
-        #raise PlaceNotFoundError(name)
-        
\ No newline at end of file
+    def search_places(self, query: str, limit: int = 10) -> List[Tuple[int, str, float]]:
+        """Ranked prefix / typo-tolerant search, returns (artic id, title, score) tuples."""
+        return self._catalog.search(query, limit)
@@ -0,0 +1,194 @@
+import re
+from bisect import insort
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Set, Tuple
+
+
+def normalize_name(name: str) -> str:
+    """Case-folds the name and collapses any run of whitespace into a single space."""
+    return " ".join(name.split()).casefold()
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def name_words(normalized: str) -> List[str]:
+    """Splits a normalized name into words, dropping punctuation."""
+    return _WORD_RE.findall(normalized)
+
+
+def name_trigrams(normalized: str, partial_last_word: bool = False) -> Set[str]:
+    """
+    Word trigrams padded like pg_trgm (two leading spaces, one trailing),
+    so short prefixes such as "pa" still produce a "  p" / " pa" trigram.
+    With partial_last_word the last word gets no trailing pad, as a query
+    being typed may stop in the middle of a word.
+    """
+    trigrams = set()
+    words = name_words(normalized)
+    for i, word in enumerate(words):
+        padded = f"  {word}" if partial_last_word and i == len(words) - 1 else f"  {word} "
+        trigrams.update(padded[j:j + 3] for j in range(len(padded) - 2))
+    return trigrams
+
+
+class PlaceCatalog:
+    """
+    Artic id -> title map with reverse (title -> ids) indexes kept in sync.
+    Titles shared by several places resolve to their ids in ascending order,
+    so the same name always maps to the same artic id.
+    """
+    # Max postings read per search before the remaining (most common) trigrams are skipped
+    SEARCH_POSTINGS_BUDGET = 5000
+
+    def __init__(self, places: Mapping[int, str] | None = None):
+        self._places: Dict[int, str] = {}
+        self._name_index: Dict[str, List[int]] = {}
+        self._normalized_index: Dict[str, List[int]] = {}
+        # trigram -> normalized titles containing it, for prefix / typo-tolerant search
+        self._trigram_index: Dict[str, Set[str]] = {}
+        self._trigram_counts: Dict[str, int] = {}
+
+        if places:
+            self.update(places)
+
+    def __len__(self) -> int:
+        return len(self._places)
+
+    @property
+    def places(self) -> Mapping[int, str]:
+        """Read-only view of the cached places, mutate through add/update/remove."""
+        return MappingProxyType(self._places)
+
+    def add(self, artic_id: int, title: str):
+        old_title = self._places.get(artic_id)
+        if old_title == title:
+            return
+
+        if old_title is not None:
+            self._unindex(artic_id, old_title)
+
+        self._places[artic_id] = title
+        self._index(artic_id, title)
+
+    def update(self, places: Mapping[int, str]):
+        for artic_id, title in places.items():
+            self.add(artic_id, title)
+
+    def remove(self, artic_id: int):
+        title = self._places.pop(artic_id, None)
+        if title is not None:
+            self._unindex(artic_id, title)
+
+    def get_ids(self, name: str, normalized: bool = False) -> List[int]:
+        """Returns every artic id with the given title, lowest id first."""
+        if normalized:
+            return list(self._normalized_index.get(normalize_name(name), ()))
+        return list(self._name_index.get(name, ()))
+
+    def get_id(self, name: str, normalized: bool = False) -> int | None:
+        """Returns the lowest artic id with the given title or None."""
+        index = self._normalized_index if normalized else self._name_index
+        key = normalize_name(name) if normalized else name
+
+        ids = index.get(key)
+        return ids[0] if ids else None
+
+    def search(self, query: str, limit: int = 10, min_similarity: float = 0.3) -> List[Tuple[int, str, float]]:
+        """
+        Ranked prefix and typo-tolerant search over the catalog titles.
+        Returns up to limit (artic id, title, score) tuples, best first:
+        exact match 1.0, title prefix ~0.9, word prefixes ~0.7,
+        otherwise trigram similarity if it reaches min_similarity.
+        """
+        key = normalize_name(query)
+        query_trigrams = name_trigrams(key, partial_last_word=True)
+        if not query_trigrams:
+            return []
+
+        # 1. Collect candidates from the rarest trigrams first and stop once enough postings
+        # were read, so common trigrams like "  s" don't make the cost grow with the catalog
+        overlaps: Counter = Counter()
+        scanned = 0
+        for trigram in sorted(query_trigrams, key=lambda t: len(self._trigram_index.get(t, ()))):
+            postings = self._trigram_index.get(trigram)
+            if not postings:
+                continue
+            if scanned and scanned + len(postings) > self.SEARCH_POSTINGS_BUDGET:
+                break
+            overlaps.update(postings)
+            scanned += len(postings)
+
+        # 2. Score the best overlapping candidates only
+        query_words = name_words(key)
+        scored = []
+        for candidate, _ in overlaps.most_common(max(limit * 10, 50)):
+            overlap = len(query_trigrams & name_trigrams(candidate))
+            score = self._score(key, query_words, candidate, overlap, len(query_trigrams))
+            if score >= min_similarity:
+                scored.append((score, candidate))
+
+        # Ties go to the shorter, then alphabetically first title
+        scored.sort(key=lambda item: (-item[0], len(item[1]), item[1]))
+
+        results = []
+        for score, candidate in scored[:limit]:
+            artic_id = self._normalized_index[candidate][0]
+            results.append((artic_id, self._places[artic_id], round(score, 4)))
+        return results
+
+    def _score(self, key: str, query_words: List[str], candidate: str, overlap: int, query_trigram_count: int) -> float:
+        if candidate == key:
+            return 1.0
+
+        # Prefix checks ignore punctuation, so "paris fr" matches "Paris, France"
+        candidate_words = name_words(candidate)
+        query_text, candidate_text = " ".join(query_words), " ".join(candidate_words)
+
+        # Longer matched share of the title ranks higher inside a tier
+        coverage = min(len(query_text) / max(len(candidate_text), 1), 1.0)
+        if candidate_text.startswith(query_text):
+            return 0.9 + 0.09 * coverage
+
+        if all(any(word.startswith(q) for word in candidate_words) for q in query_words):
+            return 0.7 + 0.09 * coverage
+
+        # Jaccard similarity of the trigram sets
+        union = query_trigram_count + self._trigram_counts[candidate] - overlap
+        return 0.69 * overlap / union
+
+    def _index(self, artic_id: int, title: str):
+        insort(self._name_index.setdefault(title, []), artic_id)
+
+        key = normalize_name(title)
+        ids = self._normalized_index.setdefault(key, [])
+        if not ids:
+            trigrams = name_trigrams(key)
+            self._trigram_counts[key] = len(trigrams)
+            for trigram in trigrams:
+                self._trigram_index.setdefault(trigram, set()).add(key)
+        insort(ids, artic_id)
+
+    def _unindex(self, artic_id: int, title: str):
+        for index, key in ((self._name_index, title), (self._normalized_index, normalize_name(title))):
+            ids = index.get(key)
+            if not ids:
+                continue
+            ids.remove(artic_id)
+            if not ids:
+                del index[key]
+
+        key = normalize_name(title)
+        if key in self._normalized_index:
+            return
+
+        # Last place with this title is gone, drop it from the search index too
+        self._trigram_counts.pop(key, None)
+        for trigram in name_trigrams(key):
+            keys = self._trigram_index.get(trigram)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._trigram_index[trigram]
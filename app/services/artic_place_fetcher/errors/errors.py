@@ -8,7 +8,37 @@ class ArricFetcherBaseError(Exception):
         super().__init__(self.message)
 
 class ArticPlaceNotFoundError(ArricFetcherBaseError):
-    """Raised when a specific artic place ID is not found."""
+    """Raised when a specific artic place name is not found."""
     def __init__(self, name: str):
         self.name = name
-        super().__init__(f"Artic place with ID '{name}' could not be found.")
\ No newline at end of file
+        super().__init__(f"Artic place with name '{name}' could not be found.")
+
+class ArticSnapshotError(ArricFetcherBaseError):
+    """Raised when the on-disk catalog snapshot can't be used."""
+    def __init__(self, path: str, reason: str):
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Artic catalog snapshot '{path}' is unusable: {reason}.")
+
+
+class CatalogNotReadyError(ArricFetcherBaseError):
+    """Raised when a request needs the catalog before its initial load finished."""
+    def __init__(self, waited: float):
+        self.waited = waited
+        super().__init__(f"Artic catalog is still loading, not ready after waiting {waited:g}s.")
+
+
+class ArticPageFetchError(ArricFetcherBaseError):
+    """Raised when a catalog page can't be fetched after all retries."""
+    def __init__(self, page: int, reason: str):
+        self.page = page
+        self.reason = reason
+        super().__init__(f"Artic page {page} could not be fetched: {reason}")
+
+
+class ArticUpstreamError(ArricFetcherBaseError):
+    """Raised when the Artic API can't answer a lookup, unlike a confirmed miss."""
+    def __init__(self, name: str, reason: str):
+        self.name = name
+        self.reason = reason
+        super().__init__(f"Artic API lookup for '{name}' failed: {reason}")
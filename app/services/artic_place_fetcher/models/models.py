@@ -1,4 +1,5 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
+from datetime import datetime
 from typing import List, Optional
 
 class ArticPlace(BaseModel):
@@ -11,4 +12,34 @@ class Pagination(BaseModel):
 
 class ArticResponse(BaseModel):
     pagination: Pagination
-    data: List[ArticPlace]
\ No newline at end of file
+    data: List[ArticPlace]
+
+class ArticSearchResponse(BaseModel):
+    data: List[ArticPlace]
+
+class CrawlReport(BaseModel):
+    total_pages: int = 0
+    fetched_pages: int = 0
+    missing_pages: List[int] = Field(default_factory=list)
+    entries: int = 0
+    duration: float = 0.0
+
+    @property
+    def is_complete(self) -> bool:
+        return self.total_pages > 0 and not self.missing_pages
+
+class CatalogReadiness(BaseModel):
+    ready: bool
+    entry_count: int
+    loading: bool
+    load_attempts: int = 0
+    load_elapsed: Optional[float] = None
+    crawl_progress: Optional[CrawlReport] = None
+
+class CatalogRefreshInfo(BaseModel):
+    last_refresh_at: Optional[datetime] = None
+    last_duration: Optional[float] = None
+    entry_count: int = 0
+    refreshing: bool = False
+    background_refresh: bool = False
+    last_report: Optional[CrawlReport] = None
\ No newline at end of file
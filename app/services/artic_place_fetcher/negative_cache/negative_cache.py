@@ -0,0 +1,43 @@
+import time
+from collections import OrderedDict
+
+
+class NegativeCache:
+    """Bounded LRU set of recently confirmed misses, every entry expires after ttl seconds."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._expires_at: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def __contains__(self, key: str) -> bool:
+        expires_at = self._expires_at.get(key)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.monotonic():
+            del self._expires_at[key]
+            return False
+
+        self._expires_at.move_to_end(key)
+        return True
+
+    def add(self, key: str):
+        if self._max_size <= 0:
+            return
+
+        self._expires_at[key] = time.monotonic() + self._ttl
+        self._expires_at.move_to_end(key)
+
+        # Evict the least recently used entries
+        while len(self._expires_at) > self._max_size:
+            self._expires_at.popitem(last=False)
+
+    def discard(self, key: str):
+        self._expires_at.pop(key, None)
+
+    def clear(self):
+        self._expires_at.clear()
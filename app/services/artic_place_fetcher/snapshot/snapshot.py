@@ -0,0 +1,119 @@
+import mmap
+import os
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Mapping
+from app.services.artic_place_fetcher.errors.errors import *
+
+# Layout (little-endian):
+#   header  : magic, format version, reserved, created_at (unix time), entry count
+#   ids     : count * int64
+#   lengths : count * uint32, byte length of every utf-8 title
+#   titles  : all utf-8 titles concatenated in the same order as ids
+_MAGIC = b"ARTC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHdI")
+
+
+class CatalogSnapshot:
+    """Compact, versioned on-disk copy of the artic id -> title catalog."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    def age(self) -> float | None:
+        """Seconds since the snapshot was written, None if there is no snapshot."""
+        created_at = self._read_created_at()
+        if created_at is None:
+            return None
+        return max(0.0, time.time() - created_at)
+
+    def write(self, places: Mapping[int, str]):
+        """Atomically replaces the snapshot with the given places."""
+        ids = array("q", places.keys())
+        titles = [title.encode("utf-8") for title in places.values()]
+        lengths = array("I", (len(t) for t in titles))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, time.time(), len(ids)))
+            f.write(ids.tobytes())
+            f.write(lengths.tobytes())
+            f.write(b"".join(titles))
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Readers either see the old file or the complete new one
+        os.replace(tmp_path, self.path)
+
+    def read(self, max_age: float | None = None) -> Dict[int, str] | None:
+        """
+        Loads the snapshot with a single memory map.
+        Returns None if there is no snapshot or it is older than max_age seconds.
+        Raises ArticSnapshotError if the file is corrupt or has an unknown version.
+        """
+        if not self.exists():
+            return None
+
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ArticSnapshotError(str(self.path), "file is empty")
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                created_at, count = self._unpack_header(buf)
+
+                if max_age is not None and time.time() - created_at > max_age:
+                    return None
+
+                return self._unpack_places(buf, count)
+
+    def _read_created_at(self) -> float | None:
+        try:
+            with open(self.path, "rb") as f:
+                created_at, _ = self._unpack_header(f.read(_HEADER.size))
+                return created_at
+        except (OSError, ArticSnapshotError):
+            return None
+
+    def _unpack_header(self, buf) -> tuple[float, int]:
+        if len(buf) < _HEADER.size:
+            raise ArticSnapshotError(str(self.path), "truncated header")
+
+        magic, version, _, created_at, count = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC:
+            raise ArticSnapshotError(str(self.path), "bad magic")
+        if version != _VERSION:
+            raise ArticSnapshotError(str(self.path), f"unsupported version {version}")
+
+        return created_at, count
+
+    def _unpack_places(self, buf, count: int) -> Dict[int, str]:
+        ids_start = _HEADER.size
+        lengths_start = ids_start + count * 8
+        titles_start = lengths_start + count * 4
+
+        if len(buf) < titles_start:
+            raise ArticSnapshotError(str(self.path), "truncated index")
+
+        ids = array("q")
+        ids.frombytes(buf[ids_start:lengths_start])
+        lengths = array("I")
+        lengths.frombytes(buf[lengths_start:titles_start])
+
+        if len(buf) != titles_start + sum(lengths):
+            raise ArticSnapshotError(str(self.path), "truncated titles")
+
+        places: Dict[int, str] = {}
+        offset = titles_start
+        for artic_id, length in zip(ids, lengths):
+            places[artic_id] = buf[offset:offset + length].decode("utf-8")
+            offset += length
+
+        return places
@@ -13,6 +13,12 @@ class PlaceNotFoundError(ProjectBaseError):
         self.project_id = project_id
         super().__init__(f"Project (id = {project_id}) place with ID '{place_id}' could not be found.")
 
+class PlaceIdNotFoundError(ProjectBaseError):
+    """Raised when a place ID is not found in any project."""
+    def __init__(self, place_id: int):
+        self.place_id = place_id
+        super().__init__(f"Place with ID '{place_id}' could not be found.")
+
 class ProjectNotFoundError(ProjectBaseError):
     """Raised when a specific project ID is not found."""
     def __init__(self, project_id: int):
@@ -48,4 +54,15 @@ class ProjectHasMaxPlacesAllowedError(ProjectBaseError):
     """Raised when project has a MARKED place ."""
     def __init__(self, project_id: int):
         self.project_id = project_id
-        super().__init__(f"Project with ID '{project_id}' has maximum places allowed places.")
\ No newline at end of file
+        super().__init__(f"Project with ID '{project_id}' has maximum places allowed places.")
+
+class InvalidCursorError(ProjectBaseError):
+    """Raised when a pagination cursor can't be decoded."""
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Cursor '{cursor}' is not valid.")
+
+class SearchIndexNotReadyError(ProjectBaseError):
+    """Raised when a search comes in before the stored projects are indexed."""
+    def __init__(self):
+        super().__init__("Project search index is still being built.")
@@ -0,0 +1,30 @@
+import threading
+
+
+class IdAllocator:
+    """Hands out increasing ids, safe to call from many threads at once."""
+
+    def __init__(self, start: int = 0):
+        self._next_id = start
+        self._lock = threading.Lock()
+
+    @property
+    def next_id(self) -> int:
+        """The id the next allocate() call returns."""
+        return self._next_id
+
+    def allocate(self) -> int:
+        with self._lock:
+            allocated = self._next_id
+            self._next_id += 1
+            return allocated
+
+    def reserve(self, used_id: int):
+        """Makes sure an id assigned elsewhere (storage, a shared allocator) is never handed out again."""
+        with self._lock:
+            if used_id >= self._next_id:
+                self._next_id = used_id + 1
+
+    def reset(self, start: int = 0):
+        with self._lock:
+            self._next_id = start
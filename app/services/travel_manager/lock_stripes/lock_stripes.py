@@ -0,0 +1,15 @@
+import threading
+from typing import List
+
+
+class LockStripes:
+    """
+    Fixed pool of locks shared by all projects, a project always maps to the same one.
+    Mutations of different projects rarely contend, without a lock per project.
+    """
+
+    def __init__(self, stripes: int = 64):
+        self._locks: List[threading.RLock] = [threading.RLock() for _ in range(stripes)]
+
+    def for_project(self, project_id: int) -> threading.RLock:
+        return self._locks[project_id % len(self._locks)]
@@ -0,0 +1,106 @@
+import heapq
+import threading
+from bisect import bisect_right
+from itertools import islice
+from typing import Dict, List, Set
+from app.services.travel_manager.project_ids.project_ids import ProjectIdList
+
+
+class ProjectNameIndex:
+    """
+    Lower-cased project names plus a trigram -> project ids index,
+    so substring filters only verify projects sharing every trigram of the filter.
+    Safe to share between threads.
+    """
+
+    def __init__(self):
+        self._names: Dict[int, str] = {}
+        self._trigrams: Dict[str, Set[int]] = {}
+        # Ascending ids, short filters scan names in id order and stop once a page is full
+        self._ids = ProjectIdList()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, project_id: int, name: str):
+        with self._lock:
+            # A rename keeps its place in the id list
+            old_key = self._names.get(project_id)
+            if old_key is None:
+                self._ids.add(project_id)
+            else:
+                self._drop_trigrams(project_id, old_key)
+
+            key = name.lower()
+            self._names[project_id] = key
+            for trigram in self._key_trigrams(key):
+                self._trigrams.setdefault(trigram, set()).add(project_id)
+
+    def remove(self, project_id: int):
+        with self._lock:
+            key = self._names.pop(project_id, None)
+            if key is None:
+                return
+            self._ids.remove(project_id)
+            self._drop_trigrams(project_id, key)
+
+    def match(self, name_filter: str, after: int | None = None, limit: int | None = None) -> List[int]:
+        """
+        Returns the ids of projects whose name contains name_filter (case-insensitive), ascending.
+        Only ids greater than after are returned, at most limit of them, so a page never
+        orders more matches than it shows.
+        """
+        needle = name_filter.lower()
+
+        with self._lock:
+            # Filters shorter than a trigram can't use the index
+            if len(needle) >= 3:
+                postings = sorted((self._trigrams.get(t, set()) for t in self._key_trigrams(needle)), key=len)
+                # Few candidates: verify and order just those. Many: a scan in id order
+                # fills the page after about limit * len / candidates names
+                if limit is None or len(postings[0]) ** 2 <= limit * len(self._names):
+                    return self._match_candidates(needle, postings, after, limit)
+
+            return self._scan(needle, after, limit)
+
+    def _match_candidates(self, needle: str, postings: List[Set[int]], after: int | None, limit: int | None) -> List[int]:
+        # Intersect from the smallest posting set up
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            if not candidates:
+                break
+            candidates &= ids
+
+        verified = (
+            p_id for p_id in candidates
+            if (after is None or p_id > after) and needle in self._names[p_id]
+        )
+        if limit is None:
+            return sorted(verified)
+        return heapq.nsmallest(limit, verified)
+
+    def _scan(self, needle: str, after: int | None, limit: int | None) -> List[int]:
+        ids, count = self._ids.view()
+        start = bisect_right(ids, after, 0, count) if after is not None else 0
+
+        matches = []
+        for p_id in islice(ids, start, count):
+            if needle in self._names[p_id]:
+                matches.append(p_id)
+                if len(matches) == limit:
+                    break
+        return matches
+
+    @staticmethod
+    def _key_trigrams(key: str) -> Set[str]:
+        return {key[i:i + 3] for i in range(len(key) - 2)}
+
+    def _drop_trigrams(self, project_id: int, key: str):
+        for trigram in self._key_trigrams(key):
+            ids = self._trigrams.get(trigram)
+            if ids is None:
+                continue
+            ids.discard(project_id)
+            if not ids:
+                del self._trigrams[trigram]
@@ -1,19 +1,59 @@
+from typing import Dict
 from app.core.logger.logger import AppLogger
+from app.services.travel_manager.id_allocator.id_allocator import IdAllocator
 from app.api.models.models import *
 
+# Enough for every Artic title, names past the cap are just stored unshared
+NAME_POOL_MAX_SIZE = 65536
+_name_pool: Dict[str, str] = {}
+
+
+def intern_name(value: str) -> str:
+    """
+    Places share a few thousand Artic titles, the pool keeps one copy of each.
+    Unlike sys.intern the pool is capped, names are user input and interned
+    strings are never freed. Notes are free text and aren't pooled at all.
+    """
+    shared = _name_pool.get(value)
+    if shared is not None:
+        return shared
+    if len(_name_pool) < NAME_POOL_MAX_SIZE:
+        # setdefault so concurrent callers agree on one copy
+        return _name_pool.setdefault(value, value)
+    return value
+
+
 class ProjectPlace:
+    # No per-instance __dict__, there can be millions of places in memory
+    __slots__ = ("_id", "_artic_id", "_note", "_name", "_visited")
+
     _place_logger = AppLogger("PROJECTPLACE", "project_place.log")
-    _id_counter = 0
+    _ids = IdAllocator()
 
-    def __init__(self, name: str, artic_id: int, note: str | None = None):
-        self._id = self._id_counter
-        ProjectPlace._id_counter+=1
+    def __init__(self, name: str, artic_id: int, note: str | None = None, place_id: int | None = None):
+        if place_id is None:
+            place_id = self._ids.allocate()
+        else:
+            # Assigned by a shared allocator, keep the local one ahead of it
+            self._ids.reserve(place_id)
+        self._id = place_id
         
         self._artic_id = artic_id
         self._note = note
-        self._name = name
+        self._name = intern_name(name)
         self._visited = False
-        self._place_logger.logger.info(f"Created place {self._id}")
+        self._place_logger.logger.info("Created place %s", self._id)
+
+    @classmethod
+    def restore(cls, place_id: int, name: str, artic_id: int, note: str | None, visited: bool) -> "ProjectPlace":
+        """Rebuilds a stored place with its original id, the id counter is left untouched."""
+        place = cls.__new__(cls)
+        place._id = place_id
+        place._artic_id = artic_id
+        place._note = note
+        place._name = intern_name(name)
+        place._visited = visited
+        return place
 
     def get_response_model(self)->PlaceResponse:
         model = PlaceResponse(
@@ -26,13 +66,13 @@ class ProjectPlace:
 
     def update_place(self, name: str, note: str | None = None):
         self._note = note
-        self._name = name
-        self._place_logger.logger.info(f"Updated place {self._id}")
+        self._name = intern_name(name)
+        self._place_logger.logger.info("Updated place %s", self._id)
 
     def mark_visited(self):
         """Unmarking is prohibited same as deleting projects that contain marked Places"""
         self._visited = True
-        self._place_logger.logger.info(f"Masked place {self._id} as visited")
+        self._place_logger.logger.info("Masked place %s as visited", self._id)
 
     def is_visited(self):
         return self._visited
\ No newline at end of file
@@ -1,6 +1,9 @@
+import itertools
+import threading
 from app.services.travel_manager.place.place import ProjectPlace
+from app.services.travel_manager.id_allocator.id_allocator import IdAllocator
 from datetime import datetime
-from typing import List
+from typing import Callable, Dict, Iterable, List
 from app.services.travel_manager.errors.errors import *
 from app.core.config.config import travel_project_settings
 from app.core.logger.logger import AppLogger
@@ -8,43 +11,154 @@ from app.api.models.models import *
 
 
 class TravelProject():
-    _id_counter = 0
+    # No per-instance __dict__, keeps the per-project overhead down
+    __slots__ = (
+        "_id", "_name", "_description", "_start_date",
+        "_places_by_id", "_places_by_artic_id", "_visited_count", "_version",
+        "_places_loader", "_generation",
+    )
+
+    _ids = IdAllocator()
+    # Numbers every instance, a project reloaded from storage restarts its version
+    # at 0 and must not repeat the revisions of the instance it replaces
+    _generations = itertools.count(1)
+    # Guards the one-time lazy load of stored places
+    _places_load_lock = threading.Lock()
     _travel_logger = AppLogger("TRAVELPROJECT", "travel_project.log")
 
-    def __init__(self, name: str, description:str | None = None, start_date: datetime | None = None):
-        self._id = self._id_counter
-        TravelProject._id_counter+=1
+    def __init__(
+        self, name: str, description:str | None = None, start_date: datetime | None = None, project_id: int | None = None
+    ):
+        if project_id is None:
+            project_id = self._ids.allocate()
+        else:
+            # Assigned by a shared allocator, keep the local one ahead of it
+            self._ids.reserve(project_id)
+        self._id = project_id
 
         self._name = name
         self._description = description
         self._start_date = start_date
-        self._project_places: List[ProjectPlace] = []
+        # Both dicts keep insertion order, responses list places in the order they were added
+        self._places_by_id: Dict[int, ProjectPlace] = {}
+        self._places_by_artic_id: Dict[int, ProjectPlace] = {}
+        self._visited_count = 0
+        # Bumped on every change, cached responses of older versions are stale
+        self._version = 0
+        self._generation = next(self._generations)
+        # Set for projects restored from storage whose places haven't been read yet
+        self._places_loader: Callable[["TravelProject"], Iterable[ProjectPlace]] | None = None
+
+        self._travel_logger.logger.info("Created new project %s", self._id)
+
+    @classmethod
+    def restore(
+        cls,
+        project_id: int,
+        name: str,
+        description: str | None,
+        start_date: datetime | None,
+        places_loader: Callable[["TravelProject"], Iterable[ProjectPlace]] | None = None,
+    ) -> "TravelProject":
+        """
+        Rebuilds a stored project with its original id, the id counter is left untouched.
+        With places_loader the places are only fetched the first time they are needed.
+        """
+        project = cls.__new__(cls)
+        project._id = project_id
+        project._name = name
+        project._description = description
+        project._start_date = start_date
+        project._places_by_id = {}
+        project._places_by_artic_id = {}
+        project._visited_count = 0
+        project._version = 0
+        project._generation = next(cls._generations)
+        project._places_loader = places_loader
+        return project
+
+    def attach_places(self, places: Iterable[ProjectPlace]):
+        """Adds already stored places, skipping the limit and duplicate checks."""
+        for place in places:
+            self._places_by_id[place._id] = place
+            self._places_by_artic_id[place._artic_id] = place
+            if place.is_visited():
+                self._visited_count += 1
+
+    def _ensure_places(self):
+        if self._places_loader is None:
+            return
+
+        # Read outside the lock, it may wait on storage; a concurrent duplicate read is harmless
+        loader = self._places_loader
+        places = list(loader(self))
+
+        with self._places_load_lock:
+            # Another thread may have attached them meanwhile
+            if self._places_loader is not loader:
+                return
+            self.attach_places(places)
+            self._places_loader = None
+
+    def load_places(self):
+        """
+        Attaches lazily stored places now. Storage has its own lock, which writers take
+        before the project's stripe lock, so load before taking the stripe, never under it.
+        """
+        self._ensure_places()
+
+    def get_version(self) -> int:
+        return self._version
+
+    def get_revision(self) -> str:
+        """Changes whenever the response would, also across reloads of the same project id."""
+        return f"{self._generation}.{self._version}"
+
+    def get_response_model(
+        self, keep_places: bool = True, stored_places: List[ProjectPlace] | None = None
+    )->ProjectResponse:
+        """
+        keep_places=False reads places that aren't loaded yet for this response only,
+        so an export doesn't pull every stored place into memory; see read_places
+        for stored_places.
+        """
+        if keep_places:
+            self._ensure_places()
+            places = list(self._places_by_id.values())
+        else:
+            places = self.read_places(stored_places)
 
-        self._travel_logger.logger.info(f"Created new project {self._id}")
-
-    def get_response_model(self)->ProjectResponse:
         model = ProjectResponse(
             id=self._id,
             name=self._name,
             description=self._description,
             start_time=self._start_date,
-            places=[pl.get_response_model() for pl in self._project_places]
+            places=[pl.get_response_model() for pl in places]
         )
         return model
 
-    def add_place(self, artic_id: int, place_create: PlaceCreate, place_limit:int = travel_project_settings.PLACES_LIMIT) -> PlaceResponse:
-        if any(pp._artic_id == artic_id for pp in self._project_places):
+    def add_place(
+        self,
+        artic_id: int,
+        place_create: PlaceCreate,
+        place_limit:int = travel_project_settings.PLACES_LIMIT,
+        place_id: int | None = None,
+    ) -> PlaceResponse:
+        self._ensure_places()
+        if artic_id in self._places_by_artic_id:
             self._travel_logger.logger.error("Trying to add dublicate place to project")
-            raise DuplicatePlaceError(id, self._id)
+            raise DuplicatePlaceError(artic_id, self._id)
         
-        if(len(self._project_places) >= place_limit):
+        if(len(self._places_by_id) >= place_limit):
             self._travel_logger.logger.error("Trying to add place to full project")
             raise ProjectHasMaxPlacesAllowedError(self._id)
         
-        self._travel_logger.logger.info(f"Adding place with artic id : {artic_id}")
+        self._travel_logger.logger.info("Adding place with artic id : %s", artic_id)
 
-        new_place = ProjectPlace(place_create.name, artic_id, place_create.note)
-        self._project_places.append(new_place)
+        new_place = ProjectPlace(place_create.name, artic_id, place_create.note, place_id)
+        self._places_by_id[new_place._id] = new_place
+        self._places_by_artic_id[artic_id] = new_place
+        self._version += 1
 
         return new_place.get_response_model()
 
@@ -52,35 +166,75 @@ class TravelProject():
         self._name = project_update.name
         self._description = project_update.description
         self._start_date = project_update.start_date
-        self._travel_logger.logger.info(f"Updated project {self._id}")
+        self._version += 1
+        self._travel_logger.logger.info("Updated project %s", self._id)
+
+    def get_place(self, place_id: int) -> ProjectPlace:
+        self._ensure_places()
+        project_place = self._places_by_id.get(place_id)
+
+        if not project_place:
+            raise PlaceNotFoundError(place_id, self._id)
+
+        return project_place
 
     def update_place(self, place_update: PlaceUpdate):
-        project_place = next((x for x in self._project_places if x._id == place_update.id), None)
+        self._ensure_places()
+        project_place = self._places_by_id.get(place_update.id)
 
         if not project_place:
             self._travel_logger.logger.error("Place id is not found in project")
             raise PlaceNotFoundError(place_update.id, self._id)
         
-        self._travel_logger.logger.info(f"Updated place {place_update.id}")
+        self._travel_logger.logger.info("Updated place %s", place_update.id)
         project_place.update_place(place_update.name, place_update.note)
+        self._version += 1
 
     def mark_place_visited(self, place_id:int) -> PlaceResponse:
-        project_place = next((x for x in self._project_places if x._id == place_id), None)
-
-        if not project_place:
-            raise PlaceNotFoundError(place_id, self._id)
-        
+        project_place = self.get_place(place_id)
 
-        self._travel_logger.logger.info(f"Marked place {place_id} as visited")
-        project_place.mark_visited()
+        # Marking is idempotent, only the first one changes the project
+        if not project_place.is_visited():
+            self._travel_logger.logger.info("Marked place %s as visited", place_id)
+            project_place.mark_visited()
+            self._visited_count += 1
+            self._version += 1
 
         return project_place.get_response_model()
 
+    def get_place_ids(self) -> List[int]:
+        self._ensure_places()
+        return list(self._places_by_id)
+
+    def get_places(self) -> List[ProjectPlace]:
+        self._ensure_places()
+        return list(self._places_by_id.values())
+
+    def read_stored_places(self) -> List[ProjectPlace] | None:
+        """
+        Places that aren't loaded yet, read for the caller only and not kept; None once
+        they are loaded. Storage has its own lock, which writers take before the
+        project's stripe lock, so call this before taking the stripe, never under it.
+        """
+        loader = self._places_loader
+        return list(loader(self)) if loader is not None else None
+
+    def read_places(self, stored_places: List[ProjectPlace] | None = None) -> List[ProjectPlace]:
+        """
+        Current places, lazily stored ones are read for the caller only and not kept.
+        stored_places from an earlier read_stored_places stand in for them, so no
+        storage read happens here; they are ignored once the places got loaded.
+        """
+        loader = self._places_loader
+        if loader is None:
+            return list(self._places_by_id.values())
+        return stored_places if stored_places is not None else list(loader(self))
+
+    def get_places_count(self) -> int:
+        self._ensure_places()
+        return len(self._places_by_id)
 
     def is_deletable(self)->bool:
         """Can't delete project with any marked places"""
-        for pp in self._project_places:
-            if pp.is_visited():
-                return False
-            
-        return True
+        self._ensure_places()
+        return self._visited_count == 0
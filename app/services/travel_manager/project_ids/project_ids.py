@@ -0,0 +1,49 @@
+import threading
+from bisect import bisect_left, insort
+from typing import List, Tuple
+
+
+class ProjectIdList:
+    """
+    Ascending project ids with lock-free reads.
+    view() returns (ids, count): the first count entries of ids are a consistent
+    snapshot that stays valid while writers go on. New ids normally arrive in
+    order and are appended in place, which never touches that prefix; removals
+    and out-of-order inserts copy the list and publish the copy (copy-on-write).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._view: Tuple[List[int], int] = ([], 0)
+
+    def __len__(self) -> int:
+        return self._view[1]
+
+    def view(self) -> Tuple[List[int], int]:
+        return self._view
+
+    def add(self, project_id: int):
+        with self._lock:
+            ids, count = self._view
+            # Ids are handed out in increasing order, append is the common case
+            if len(ids) == count and (not count or project_id > ids[-1]):
+                ids.append(project_id)
+                self._view = (ids, count + 1)
+                return
+
+            ids = ids[:count]
+            insort(ids, project_id)
+            self._view = (ids, count + 1)
+
+    def remove(self, project_id: int):
+        with self._lock:
+            ids, count = self._view
+            position = bisect_left(ids, project_id, 0, count)
+            if position == count or ids[position] != project_id:
+                return
+
+            self._view = (ids[:position] + ids[position + 1:count], count - 1)
+
+    def clear(self):
+        with self._lock:
+            self._view = ([], 0)
@@ -0,0 +1,72 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple
+from app.services.travel_manager.project.project import TravelProject
+from app.api.models.models import *
+
+
+class ProjectResponseCache:
+    """
+    Bounded LRU of serialized ProjectResponse JSON keyed by project id.
+    Every entry remembers the project version it was built from and is
+    rebuilt as soon as the project reports a newer one.
+    Serialization runs outside the lock, only the LRU bookkeeping is guarded.
+    build makes the response of a missing entry, TravelProject.get_response_model
+    unless the owner needs to guard the read.
+    """
+
+    def __init__(self, max_size: int, build: Callable[[TravelProject], ProjectResponse] | None = None):
+        self._max_size = max_size
+        self._build = build or TravelProject.get_response_model
+        self._entries: OrderedDict[int, Tuple[int, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, project: TravelProject) -> bytes:
+        """Returns the serialized response of the project's current version."""
+        version = project.get_version()
+        with self._lock:
+            entry = self._entries.get(project._id)
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                self._entries.move_to_end(project._id)
+                return entry[1]
+            self.misses += 1
+
+        payload = self._build(project).model_dump_json().encode()
+
+        if self._max_size > 0:
+            with self._lock:
+                self._entries[project._id] = (version, payload)
+                self._entries.move_to_end(project._id)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+        return payload
+
+    def peek(self, project: TravelProject) -> bytes | None:
+        """The cached response of the project's current version, without counting or reordering."""
+        entry = self._entries.get(project._id)
+        if entry is not None and entry[0] == project.get_version():
+            return entry[1]
+        return None
+
+    def discard(self, project_id: int):
+        with self._lock:
+            self._entries.pop(project_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+            max_size=self._max_size,
+        )
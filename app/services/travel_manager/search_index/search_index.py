@@ -0,0 +1,185 @@
+import heapq
+import math
+import threading
+from collections import Counter
+from typing import Dict, List, Tuple
+from app.services.artic_place_fetcher.catalog.catalog import name_words, normalize_name
+from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.place.place import ProjectPlace
+
+# Term weight per field, a word in the project name counts three times a word in a note
+NAME_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+PLACE_NAME_WEIGHT = 2.0
+PLACE_NOTE_WEIGHT = 1.0
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def search_terms(text: str | None) -> List[str]:
+    return name_words(normalize_name(text)) if text else []
+
+
+class ProjectSearchIndex:
+    """
+    Inverted index (term -> project id -> weighted term frequency) over project names,
+    descriptions, place names and place notes, ranked with BM25.
+    A changed project is re-indexed on its own, its old postings are dropped using
+    the terms remembered per project. A query only touches the postings of its terms,
+    so its cost follows the number of matches, not the number of projects.
+
+    Built in the background, see TravelManager._build_search_index: until enable()
+    is called the updates are no-ops, so restoring stored projects doesn't index them
+    one by one. Lazily stored places are read without loading them into the project.
+    Safe to share between threads, terms are computed before the index lock is taken
+    so it is never held during storage reads.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._doc_terms: Dict[int, Dict[str, float]] = {}
+        self._doc_lengths: Dict[int, float] = {}
+        self._total_length = 0.0
+        self._enabled = False
+        self._built = threading.Event()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    @property
+    def built(self) -> bool:
+        return self._built.is_set()
+
+    def wait_built(self, timeout: float | None = None) -> bool:
+        return self._built.wait(timeout)
+
+    def enable(self):
+        """Starts following changes, call before indexing the existing projects."""
+        self._enabled = True
+
+    def mark_built(self):
+        self._built.set()
+
+    def add(self, project: TravelProject, stored_places: List[ProjectPlace] | None = None):
+        """
+        Indexes a new project or re-indexes a changed one. Calls for the same project
+        must not race, the manager holds the project's stripe lock. stored_places
+        as in TravelProject.read_places.
+        """
+        if not self._enabled:
+            return
+        terms = self._project_terms(project, stored_places)
+        with self._lock:
+            self._apply(project._id, terms)
+
+    def add_place(self, project_id: int, place: ProjectPlace):
+        """
+        Adds the terms of a new place to an indexed project, without re-reading its
+        other places. A project that isn't indexed yet gets the place with the rest
+        of it. Same locking contract as add.
+        """
+        if not self._enabled:
+            return
+        terms = self._place_terms(place)
+        with self._lock:
+            doc_terms = self._doc_terms.get(project_id)
+            if doc_terms is None:
+                return
+
+            for term, frequency in terms.items():
+                doc_terms[term] = doc_terms.get(term, 0.0) + frequency
+                self._postings.setdefault(term, {})[project_id] = doc_terms[term]
+            length = sum(terms.values())
+            self._doc_lengths[project_id] += length
+            self._total_length += length
+
+    def remove(self, project_id: int):
+        if not self._enabled:
+            return
+        with self._lock:
+            self._unindex(project_id)
+
+    def search(self, query: str, limit: int, offset: int = 0) -> Tuple[List[Tuple[int, float]], int]:
+        """
+        Projects containing every word of the query, best first, ties by ascending id.
+        Returns the requested page of (project id, score) and the total number of matches.
+        """
+        terms = list(dict.fromkeys(search_terms(query)))
+        if not terms:
+            return [], 0
+
+        with self._lock:
+            postings = [self._postings.get(term) for term in terms]
+            if any(posting is None for posting in postings):
+                return [], 0
+
+            # Intersect from the smallest posting set up
+            pairs = sorted(zip(terms, postings), key=lambda pair: len(pair[1]))
+            candidates = set(pairs[0][1])
+            for _, posting in pairs[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return [], 0
+
+            doc_count = len(self._doc_terms)
+            average_length = self._total_length / doc_count
+            idfs = [(math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5)), posting) for _, posting in pairs]
+
+            scored = []
+            for project_id in candidates:
+                norm = K1 * (1 - B + B * self._doc_lengths[project_id] / average_length)
+                score = 0.0
+                for idf, posting in idfs:
+                    frequency = posting[project_id]
+                    score += idf * frequency * (K1 + 1) / (frequency + norm)
+                scored.append((-score, project_id))
+
+        page = heapq.nsmallest(offset + limit, scored)[offset:]
+        return [(project_id, round(-score, 4)) for score, project_id in page], len(scored)
+
+    @staticmethod
+    def _project_terms(project: TravelProject, stored_places: List[ProjectPlace] | None = None) -> Dict[str, float]:
+        terms: Counter[str] = Counter()
+        for word in search_terms(project._name):
+            terms[word] += NAME_WEIGHT
+        for word in search_terms(project._description):
+            terms[word] += DESCRIPTION_WEIGHT
+        for place in project.read_places(stored_places):
+            terms.update(ProjectSearchIndex._place_terms(place))
+        return dict(terms)
+
+    @staticmethod
+    def _place_terms(place: ProjectPlace) -> Dict[str, float]:
+        terms: Counter[str] = Counter()
+        for word in search_terms(place._name):
+            terms[word] += PLACE_NAME_WEIGHT
+        for word in search_terms(place._note):
+            terms[word] += PLACE_NOTE_WEIGHT
+        return terms
+
+    def _apply(self, project_id: int, terms: Dict[str, float]):
+        if self._doc_terms.get(project_id) == terms:
+            return
+        self._unindex(project_id)
+
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[project_id] = frequency
+        self._doc_terms[project_id] = terms
+        length = sum(terms.values())
+        self._doc_lengths[project_id] = length
+        self._total_length += length
+
+    def _unindex(self, project_id: int):
+        terms = self._doc_terms.pop(project_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            posting = self._postings[term]
+            del posting[project_id]
+            if not posting:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(project_id)
@@ -1,11 +1,28 @@
-from typing import List, Dict
+import asyncio
+import base64
+import binascii
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from bisect import bisect_right
+from typing import Any, Callable, List, Dict, Iterator, Tuple
 from datetime import datetime
 from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.place.place import ProjectPlace
+from app.services.travel_manager.name_index.name_index import ProjectNameIndex
+from app.services.travel_manager.response_cache.response_cache import ProjectResponseCache
+from app.services.travel_manager.project_ids.project_ids import ProjectIdList
+from app.services.travel_manager.lock_stripes.lock_stripes import LockStripes
+from app.services.travel_manager.search_index.search_index import ProjectSearchIndex
+from app.core.config.config import travel_project_settings
 from app.services.travel_manager.errors.errors import *
 from app.services.artic_place_fetcher.errors.errors import *
 from app.core.logger.logger import AppLogger
+from app.core.metrics.metrics import metrics_registry
 from app.api.models.models import *
 from app.services.artic_place_fetcher.artic_place_fetcher import ArticPlaceFetcher
+from app.database.database import create_project_repository
 
 
 class TravelManager:
@@ -25,24 +42,161 @@ class TravelManager:
             return
         
         self._projects: Dict[int, TravelProject] = {}
+        # Ascending project ids and a name index, so listing pages never walk every project
+        self._project_ids = ProjectIdList()
+        self._name_index = ProjectNameIndex()
+        self._response_cache = ProjectResponseCache(travel_project_settings.RESPONSE_CACHE_SIZE, self._response_model)
+        # Full-text index, the stored projects are indexed in the background at startup
+        self._search_index = ProjectSearchIndex()
+        self._search_build_thread: threading.Thread | None = None
+        self._search_build_stop = threading.Event()
+        # Global place id -> owner project id, place ids are unique across projects
+        self._place_index: Dict[int, int] = {}
+        # Lock order: repository transaction -> project stripe -> registry.
+        # Place and project mutations hold their project's stripe, changes to the
+        # registry structures above also hold the registry lock; reads take no lock.
+        self._project_locks = LockStripes()
+        self._registry_lock = threading.RLock()
+        # ETag parts: the epoch keeps tags of an earlier process from matching after a
+        # restart, the collection version changes with every mutation of any project
+        self._etag_epoch = uuid.uuid4().hex[:8]
+        self._collection_version = 0
+        # Every mutation is reported to the persistence backend
+        self._repository = create_project_repository()
+        self._load_from_repository()
+        self._start_search_index_build()
+        self._register_metrics()
         self._initialized = True
         self._logger.logger.info("TravelManager initialized!")
 
+    def _register_metrics(self):
+        """Sizes are read when /metrics is scraped, mutations don't pay for them."""
+        metrics_registry.gauge("travel_projects", "Projects in memory.", lambda: len(self._projects))
+        metrics_registry.gauge("travel_places", "Places in memory, across all projects.", lambda: len(self._place_index))
+        metrics_registry.callback_counter(
+            "travel_response_cache_requests_total",
+            "Serialized project response cache lookups by result.",
+            lambda: {("hit",): self._response_cache.hits, ("miss",): self._response_cache.misses},
+            ("result",),
+        )
+        metrics_registry.gauge(
+            "travel_response_cache_entries", "Serialized project responses cached.", lambda: len(self._response_cache)
+        )
+
+    def _load_from_repository(self):
+        """Restores stored projects. Their places are read lazily, only the owner map is loaded now."""
+        counters = self._repository.load_id_counters()
+        if counters is not None:
+            TravelProject._ids.reserve(counters[0] - 1)
+            ProjectPlace._ids.reserve(counters[1] - 1)
+
+        for project in self._repository.load_projects():
+            self._register_project(project)
+        for place_id, project_id in self._repository.load_place_owners():
+            self._place_index[place_id] = project_id
+
+        if self._projects:
+            self._logger.logger.info("Restored %s projects and %s places.", len(self._projects), len(self._place_index))
+
+    def close(self):
+        """Flushes pending writes and releases the persistence backend."""
+        self._search_build_stop.set()
+        if self._search_build_thread is not None:
+            self._search_build_thread.join()
+        self._repository.close()
+
+    def sync(self):
+        """
+        Picks up projects other worker processes changed in a shared store.
+        Only changed projects are reloaded; a no-op for single-process backends.
+        """
+        changed = self._repository.changed_projects()
+        if changed is not None and not changed:
+            return
+
+        # Same lock order as the mutations
+        with self._repository.transaction():
+            if changed is None:
+                self._reload_all()
+                return
+
+            for project_id in changed:
+                project = self._repository.load_project(project_id)
+                with self._project_lock(project_id):
+                    if project_id in self._projects:
+                        self._unregister_project(project_id)
+
+                    if project is not None:
+                        self._register_project(project)
+                        for place_id in project.get_place_ids():
+                            self._index_place(project, place_id)
+            self._bump_collection_version()
+
+    def _reload_all(self):
+        with self._registry_lock:
+            self._projects.clear()
+            self._project_ids.clear()
+            self._name_index = ProjectNameIndex()
+            self._search_index = ProjectSearchIndex()
+            self._response_cache.clear()
+            self._place_index.clear()
+            self._load_from_repository()
+            self._bump_collection_version()
+            self._start_search_index_build()
+
+    async def run_blocking(self, function: Callable[..., Any], *args) -> Any:
+        """
+        Runs a manager call from async code. With a shared store a mutation or sync()
+        can wait up to the SQLite busy timeout on other workers, so it runs in a
+        worker thread there instead of stalling the event loop.
+        """
+        if self._repository.shared:
+            return await asyncio.to_thread(function, *args)
+        return function(*args)
+
+    def _project_lock(self, project_id: int) -> threading.RLock:
+        return self._project_locks.for_project(project_id)
+
+    @contextmanager
+    def _write(self, project_id: int | None = None) -> Iterator[None]:
+        """
+        Scope of one mutation, holding the stripe of project_id when given.
+        With a shared store it runs under the store's write lock, after catching up
+        with other workers, so the checks see the latest state.
+        """
+        with self._repository.transaction():
+            self.sync()
+            try:
+                if project_id is None:
+                    yield
+                    return
+                with self._project_lock(project_id):
+                    yield
+            finally:
+                # Also after a rejected mutation, a spare invalidation is harmless
+                self._bump_collection_version()
+
+    def _bump_collection_version(self):
+        with self._registry_lock:
+            self._collection_version += 1
+
     def mark_place_visited(self, project_id: int, place_id: int) -> PlaceResponse:
         """
         Coordinates marking a place as visited. 
         Returns the updated ProjectPlace for the API response.
         """
-        # 1. Get the project (raises ProjectNotFoundError if not found)
-        project = self.get_project_by_id(project_id)
-        if not project:
-            raise ProjectNotFoundError(project_id)
+        with self._write(project_id):
+            # 1. Get the project (raises ProjectNotFoundError if not found)
+            project = self.get_project_by_id(project_id)
+            if not project:
+                raise ProjectNotFoundError(project_id)
 
-        # 2. Delegate the logic to the project instance
-        # This will raise PlaceNotFoundError if place_id isn't in this project
-        updated_place_model = project.mark_place_visited(place_id)
+            # 2. Delegate the logic to the project instance
+            # This will raise PlaceNotFoundError if place_id isn't in this project
+            updated_place_model = project.mark_place_visited(place_id)
+            self._repository.place_updated(project, project.get_place(place_id))
 
-        self._logger.logger.info(f"Place {place_id} in Project {project_id} marked as visited.")
+        self._logger.logger.info("Place %s in Project %s marked as visited.", place_id, project_id)
 
         return updated_place_model
 
@@ -52,43 +206,71 @@ class TravelManager:
 
         # 2. Validate against Artic API and get the official ID
         # This satisfies the requirement to validate before storing
-        artic_id = self._artic_place_fetcher.get_place_id(place_data.name)
-        if not artic_id:
-            raise ArticPlaceNotFoundError(f"Can't find place in artic API name = {place_data.name}")
+        artic_id = await self._artic_place_fetcher.resolve_place_id(place_data.name)
+        if artic_id is None:
+            raise ArticPlaceNotFoundError(place_data.name)
 
         # 3. Add to project
         # The project.add_place method handles Duplicate and Max Limit checks
-        new_place_response = project.add_place(artic_id, place_data)
+        return await self.run_blocking(self._add_resolved_place, project_id, artic_id, place_data)
 
-        self._logger.logger.info(f"Successfully added place {artic_id} to project {project_id}")
-        return new_place_response
+    def _add_resolved_place(self, project_id: int, artic_id: int, place_data: PlaceCreate) -> PlaceResponse:
+        with self._write(project_id):
+            # Looked up again, it may have changed during the await
+            project = self.get_project_by_id(project_id)
+            return self._add_place(project, artic_id, place_data)
 
-    #TODO replace return type with Pydantic Model
-    def create_project(self, project_create:ProjectCreate) -> TravelProject:
-        """Creates a new project and stores it."""
-        #TODO replace constructors and other funtion parameters with Pydantic Models
-        project = TravelProject(
-            project_create.name,
-            project_create.description,
-            project_create.start_date
-        )
-        self._projects[project._id] = project
-        self._logger.logger.info(f"Project {project._id} added to manager.")
+    async def add_places_to_project(
+        self, project_id: int, places: List[PlaceCreate]
+    ) -> List[PlaceResponse | ProjectBaseError | ArricFetcherBaseError]:
+        """
+        Bulk add_place_to_project. All names are resolved in one pass, then the places
+        are added in order. Each item is either the new place or the error that rejected it.
+        """
+        self.get_project_by_id(project_id)
+        artic_ids = await self._artic_place_fetcher.resolve_place_ids(place.name for place in places)
+        return await self.run_blocking(self._add_resolved_places, project_id, places, artic_ids)
 
-        #create places for project
-        if project_create.places:
-            for place in project_create.places:
-                found_artic_id = self._artic_place_fetcher.get_place_id(place.name)
-                if found_artic_id:
-                    self._logger.logger.info(f"Place is added to recently creted project")
-                    project.add_place(found_artic_id, place)
-                else:
-                    self._logger.logger.warning(f"Place is not found in artic API : name = {place.name}")
+    def _add_resolved_places(
+        self, project_id: int, places: List[PlaceCreate], artic_ids: Dict[str, int | ArticUpstreamError | None]
+    ) -> List[PlaceResponse | ProjectBaseError | ArricFetcherBaseError]:
+        results = []
+        with self._write(project_id):
+            project = self.get_project_by_id(project_id)
+            for place in places:
+                try:
+                    artic_id = self._resolved_artic_id(artic_ids, place.name)
+                    results.append(self._add_place(project, artic_id, place))
+                except (
+                    ArticPlaceNotFoundError, ArticUpstreamError, DuplicatePlaceError, ProjectHasMaxPlacesAllowedError
+                ) as e:
+                    self._logger.logger.warning("Bulk place rejected for project %s: %s", project_id, e)
+                    results.append(e)
+
+        return results
 
-        return project
-    
     async def create_project(self, project_create: ProjectCreate) -> tuple[TravelProject, list[str]]:
         """Creates a new project and attempts to add all provided places."""
+        artic_ids = await self._artic_place_fetcher.resolve_place_ids(place.name for place in project_create.places)
+        created = await self.run_blocking(self._create_resolved_projects, [project_create], artic_ids)
+        return created[0]
+
+    async def create_projects(self, project_creates: List[ProjectCreate]) -> List[tuple[TravelProject, list[str]]]:
+        """Bulk create_project, the place names of every project are resolved in one pass."""
+        artic_ids = await self._artic_place_fetcher.resolve_place_ids(
+            place.name for project_create in project_creates for place in project_create.places
+        )
+        return await self.run_blocking(self._create_resolved_projects, project_creates, artic_ids)
+
+    def _create_resolved_projects(
+        self, project_creates: List[ProjectCreate], artic_ids: Dict[str, int | ArticUpstreamError | None]
+    ) -> List[tuple[TravelProject, list[str]]]:
+        with self._write():
+            return [self._create_project(project_create, artic_ids) for project_create in project_creates]
+
+    def _create_project(
+        self, project_create: ProjectCreate, artic_ids: Dict[str, int | ArticUpstreamError | None]
+    ) -> tuple[TravelProject, list[str]]:
         warnings = []
 
         # 1. Initialize the project
@@ -96,36 +278,93 @@ class TravelManager:
         project = TravelProject(
             project_create.name,
             project_create.description,
-            project_create.start_date
+            project_create.start_date,
+            project_id=self._repository.next_project_id(),
         )
 
-        # 2. Add to internal registry immediately
-        self._projects[project._id] = project
-        self._logger.logger.info(f"Project {project._id} created.")
+        with self._project_lock(project._id):
+            # 2. Add to internal registry immediately
+            self._register_project(project)
+            self._repository.project_created(project)
+            self._logger.logger.info("Project %s created.", project._id)
 
-        # 3. Process places one by one
-        if project_create.places:
+            # 3. Process places one by one, their Artic ids are already resolved
             for place in project_create.places:
                 try:
-                    # Use our Singleton Fetcher to find the external ID
-                    artic_id = self._artic_place_fetcher.get_place_id(place.name)
+                    artic_id = self._resolved_artic_id(artic_ids, place.name)
 
                     # add_place now handles duplicate and limit checks
-                    project.add_place(artic_id, place)
+                    self._add_place(project, artic_id, place)
 
-                except (PlaceNotFoundError, DuplicatePlaceError, ProjectHasMaxPlacesAllowedError) as e:
+                except (
+                    ArticPlaceNotFoundError, ArticUpstreamError, PlaceNotFoundError,
+                    DuplicatePlaceError, ProjectHasMaxPlacesAllowedError,
+                ) as e:
                     # Instead of crashing, we record the problem
                     err_msg = str(e)
-                    self._logger.logger.warning(f"Partial creation warning: {err_msg}")
+                    self._logger.logger.warning("Partial creation warning: %s", err_msg)
                     warnings.append(err_msg)
 
         return project, warnings
 
+    @staticmethod
+    def _resolved_artic_id(artic_ids: Dict[str, int | ArticUpstreamError | None], name: str) -> int:
+        """Artic id of a name from resolve_place_ids, raising the error that rejects the place."""
+        artic_id = artic_ids.get(name)
+        if isinstance(artic_id, ArticUpstreamError):
+            # A fresh instance, the same name can be rejected more than once
+            raise ArticUpstreamError(artic_id.name, artic_id.reason)
+        if artic_id is None:
+            raise ArticPlaceNotFoundError(name)
+        return artic_id
+
+    def _add_place(self, project: TravelProject, artic_id: int, place_create: PlaceCreate) -> PlaceResponse:
+        new_place_response = project.add_place(artic_id, place_create, place_id=self._repository.next_place_id())
+        self._index_place(project, new_place_response.id)
+        new_place = project.get_place(new_place_response.id)
+        self._search_index.add_place(project._id, new_place)
+        self._repository.place_added(project, new_place)
+
+        self._logger.logger.info("Successfully added place %s to project %s", artic_id, project._id)
+        return new_place_response
+
+    def get_place_by_id(self, place_id: int) -> ProjectPlaceResponse:
+        """Finds a place in any project by its ID."""
+        project, place = self._lookup_place(place_id)
+        return ProjectPlaceResponse(project_id=project._id, **place.get_response_model().model_dump())
+
+    def mark_place_visited_by_id(self, place_id: int) -> ProjectPlaceResponse:
+        """Marks a place as visited without knowing its project."""
+        with self._write():
+            project, _ = self._lookup_place(place_id)
+            with self._project_lock(project._id):
+                # Looked up again under the lock, the project may have been removed meanwhile
+                project, place = self._lookup_place(place_id)
+                updated_place_model = project.mark_place_visited(place._id)
+                self._repository.place_updated(project, place)
+
+        self._logger.logger.info("Place %s in Project %s marked as visited.", place_id, project._id)
+        return ProjectPlaceResponse(project_id=project._id, **updated_place_model.model_dump())
+
+    def _lookup_place(self, place_id: int) -> Tuple[TravelProject, ProjectPlace]:
+        project_id = self._place_index.get(place_id)
+        if project_id is None:
+            self._logger.logger.error("Place %s not found.", place_id)
+            raise PlaceIdNotFoundError(place_id)
+        project = self._projects.get(project_id)
+        if project is None:
+            raise PlaceIdNotFoundError(place_id)
+        return project, project.get_place(place_id)
+
+    def _index_place(self, project: TravelProject, place_id: int):
+        with self._registry_lock:
+            self._place_index[place_id] = project._id
+
     def get_project_by_id(self, project_id: int) -> TravelProject:
         """Finds a project by ID or raises an error."""
         project = self._projects.get(project_id)
         if not project:
-            self._logger.logger.error(f"Project {project_id} not found.")
+            self._logger.logger.error("Project %s not found.", project_id)
             raise ProjectNotFoundError(project_id)
         return project
     
@@ -139,25 +378,234 @@ class TravelManager:
 
     def list_projects(self) -> List[ProjectResponse]:
         """Returns all managed projects."""
-        return [x.get_response_model() for x in self._projects.values()]
+        ids, count = self._project_ids.view()
+        return [self._response_model(x) for x in self._page_projects(ids[:count])]
+
+    def query_projects(
+        self, limit: int, offset: int = 0, name_filter: str | None = None, cursor: str | None = None
+    ) -> ProjectPage:
+        """
+        Returns one page of projects ordered by id. Filtering and slicing happen on ids,
+        response models are built for the returned page only.
+        The cursor from a previous page continues right after its last project,
+        offset is applied on top of it.
+        """
+        page_ids, next_cursor = self._select_page(limit, offset, name_filter, cursor)
+        items = [self._response_model(project) for project in self._page_projects(page_ids)]
+        return ProjectPage(items=items, next_cursor=next_cursor)
+
+    def query_projects_json(
+        self, limit: int, offset: int = 0, name_filter: str | None = None, cursor: str | None = None
+    ) -> tuple[bytes, str | None]:
+        """Same page as query_projects, as a JSON array assembled from cached project responses."""
+        page_ids, next_cursor = self._select_page(limit, offset, name_filter, cursor)
+        payload = b"[" + b",".join(self._response_cache.get(project) for project in self._page_projects(page_ids)) + b"]"
+        return payload, next_cursor
+
+    def _response_model(self, project: TravelProject) -> ProjectResponse:
+        """
+        Copies the project into its response under its stripe lock, so a concurrent
+        write can't change the places or fields mid-read. Stored places are loaded
+        first, storage is always locked before the stripe.
+        """
+        project.load_places()
+        with self._project_lock(project._id):
+            return project.get_response_model()
+
+    def get_project_json(self, project_id: int) -> bytes:
+        """Serialized ProjectResponse, reused until the project changes."""
+        return self._response_cache.get(self.get_project_by_id(project_id))
+
+    def export_projects_ndjson(self) -> Iterator[bytes]:
+        """
+        Every project as one JSON line, ascending ids. Walks a snapshot of the id list
+        without copying it: projects removed meanwhile are skipped, ones created after
+        the export started aren't included. Fresh cached responses are reused, the
+        others are serialized without entering the cache so an export doesn't evict
+        the hot entries.
+        Runs in a worker thread: each project is copied into its response model under
+        its stripe lock, only the JSON encoding happens outside it. Stored places are
+        read before the lock, in the same order as writers: storage, then stripe.
+        """
+        ids, count = self._project_ids.view()
+        for index in range(count):
+            project_id = ids[index]
+            project = self._projects.get(project_id)
+            if project is None:
+                continue
+            payload = self._response_cache.peek(project)
+            if payload is None:
+                stored_places = project.read_stored_places()
+                with self._project_lock(project_id):
+                    # Removed while its places were read
+                    if project_id not in self._projects:
+                        continue
+                    model = project.get_response_model(keep_places=False, stored_places=stored_places)
+                payload = model.model_dump_json().encode()
+            yield payload + b"\n"
+
+    def get_project_etag(self, project_id: int) -> str:
+        """
+        Strong ETag of GET /projects/{project_id}. Read it before the payload: a change
+        in between gives a newer body under an older tag, which only costs a refetch.
+        """
+        return f'"{self._etag_epoch}.{self.get_project_by_id(project_id).get_revision()}"'
+
+    def get_collection_etag(self) -> str:
+        """ETag of every GET /projects/ page, changes with any project mutation."""
+        return f'"{self._etag_epoch}.c{self._collection_version}"'
+
+    def get_response_cache_stats(self) -> ResponseCacheStats:
+        return self._response_cache.get_stats()
+
+    def _select_page(
+        self, limit: int, offset: int, name_filter: str | None, cursor: str | None
+    ) -> tuple[List[int], str | None]:
+        after = self._decode_cursor(cursor) if cursor else None
+        offset = max(offset, 0)
+
+        # 1. Ascending ids after the cursor, then the offset. Filtered matches are only
+        # collected up to one past the page; the unfiltered list is a lock-free snapshot
+        if name_filter:
+            ids = self._name_index.match(name_filter, after, offset + limit + 1)
+            start, count = offset, len(ids)
+        else:
+            ids, count = self._project_ids.view()
+            start = (bisect_right(ids, after, 0, count) if after is not None else 0) + offset
+
+        # 2. The page itself
+        page_ids = ids[start:min(start + limit, count)]
+
+        next_cursor = None
+        if page_ids and start + limit < count:
+            next_cursor = self._encode_cursor(page_ids[-1])
+
+        return page_ids, next_cursor
+
+    def _page_projects(self, page_ids: List[int]) -> List[TravelProject]:
+        # A project removed after the ids were selected is skipped
+        return [project for project in map(self._projects.get, page_ids) if project is not None]
+
+    @staticmethod
+    def _encode_cursor(last_id: int) -> str:
+        return base64.urlsafe_b64encode(f"p:{last_id}".encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> int:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            prefix, last_id = raw.split(":", 1)
+            if prefix != "p":
+                raise ValueError(prefix)
+            return int(last_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidCursorError(cursor)
+
+    def _register_project(self, project: TravelProject):
+        with self._registry_lock:
+            self._projects[project._id] = project
+            self._name_index.add(project._id, project._name)
+            self._project_ids.add(project._id)
+        self._search_index.add(project)
+
+    def _unregister_project(self, project_id: int):
+        with self._registry_lock:
+            project = self._projects.pop(project_id)
+            for place_id in project.get_place_ids():
+                self._place_index.pop(place_id, None)
+            self._response_cache.discard(project_id)
+            self._name_index.remove(project_id)
+            self._project_ids.remove(project_id)
+        self._search_index.remove(project_id)
 
     def remove_project(self, project_id: int):
         """Removes a project if it's deletable (no visited places)."""
-        project = self.get_project_by_id(project_id)
-        
-        if not project.is_deletable():
-            self._logger.logger.warning(f"Attempted to delete project {project_id} with visited places.")
-            raise ProjectIsNotDeletableError(project_id)
-            
-        del self._projects[project_id]
-        self._logger.logger.info(f"Project {project_id} removed successfully.")
+        with self._write(project_id):
+            project = self.get_project_by_id(project_id)
+
+            if not project.is_deletable():
+                self._logger.logger.warning("Attempted to delete project %s with visited places.", project_id)
+                raise ProjectIsNotDeletableError(project_id)
+
+            self._unregister_project(project_id)
+            self._repository.project_removed(project_id)
+        self._logger.logger.info("Project %s removed successfully.", project_id)
 
     def update_project(self, project_update: ProjectUpdate):
         """Updates project details dynamically."""
-        project = self.get_project_by_id(project_update.id)
-        #TODO think about making name optional for update function
-        if not project:
-            self._logger.logger.error(f"Project {project_update.id} not found.")
-            raise ProjectNotFoundError(project_update.id)
-        
-        project.update_project(project_update)
\ No newline at end of file
+        with self._write(project_update.id):
+            project = self.get_project_by_id(project_update.id)
+            #TODO think about making name optional for update function
+            if not project:
+                self._logger.logger.error("Project %s not found.", project_update.id)
+                raise ProjectNotFoundError(project_update.id)
+
+            project.update_project(project_update)
+            with self._registry_lock:
+                self._name_index.add(project._id, project._name)
+            self._search_index.add(project)
+            self._repository.project_updated(project)
+
+    def update_place(self, project_id: int, place_update: PlaceUpdate):
+        """Updates the name and note of a place."""
+        with self._write(project_id):
+            project = self.get_project_by_id(project_id)
+            project.update_place(place_update)
+            self._search_index.add(project)
+            self._repository.place_updated(project, project.get_place(place_update.id))
+        self._logger.logger.info("Place %s in Project %s updated.", place_update.id, project_id)
+
+    def search_projects(self, query: str, limit: int = 10, offset: int = 0) -> ProjectSearchResponse:
+        """
+        Ranked full-text search over project names, descriptions, place names and notes.
+        Every word of the query must match. Raises SearchIndexNotReadyError while the
+        stored projects are still being indexed.
+        """
+        if not self._search_index.built:
+            raise SearchIndexNotReadyError()
+        matches, total = self._search_index.search(query, limit, offset)
+
+        results = []
+        for project_id, score in matches:
+            project = self._projects.get(project_id)
+            # Removed between the search and now
+            if project is not None:
+                results.append(ProjectSearchResult(score=score, project=self._response_model(project)))
+        return ProjectSearchResponse(results=results, total=total, limit=limit, offset=offset)
+
+    def _start_search_index_build(self):
+        """Indexes the stored projects of the current index in a background thread."""
+        self._search_build_thread = threading.Thread(
+            target=self._build_search_index, args=(self._search_index,), name="search-index-build", daemon=True
+        )
+        self._search_build_thread.start()
+
+    def _build_search_index(self, index: ProjectSearchIndex):
+        """
+        The index follows changes from the start, so projects created meanwhile are
+        indexed as they register. Each stored project is indexed under its stripe lock
+        so a concurrent change can't be overwritten by an older state. Lazily stored
+        places are read for the index only and stay unloaded, before the stripe lock
+        as writers take storage first.
+        """
+        started = time.perf_counter()
+        index.enable()
+        ids, count = self._project_ids.view()
+        for position in range(count):
+            # Stopped by close, or replaced by a reload
+            if self._search_build_stop.is_set() or self._search_index is not index:
+                return
+            project_id = ids[position]
+            project = self._projects.get(project_id)
+            if project is None:
+                continue
+            try:
+                stored_places = project.read_stored_places()
+                with self._project_lock(project_id):
+                    # A project reloaded meanwhile was indexed when it registered
+                    if self._projects.get(project_id) is project:
+                        index.add(project, stored_places)
+            except Exception as e:
+                self._logger.logger.error("Can't index project %s: %s", project_id, e)
+        index.mark_built()
+        self._logger.logger.info("Search index built over %s projects in %.2fs.", len(index), time.perf_counter() - started)
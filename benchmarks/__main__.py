@@ -0,0 +1,31 @@
+"""
+Runs the reproducible suite: microbenchmarks, then the end-to-end load scenario
+against the local Artic stand-in. Every result is a JSON line tagged with the
+commit, append them to one file to compare runs across commits.
+
+    python -m benchmarks --output results.jsonl
+    python -m benchmarks --quick
+"""
+import argparse
+import sys
+
+from benchmarks import load, micro
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="Append results to this JSON lines file")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes and a short load run")
+    args = parser.parse_args(argv)
+
+    output = ["--output", args.output] if args.output else []
+    if args.quick:
+        micro.main(["--catalog-size", "10000", "--projects", "500", "--batch", "2000", "--repeat", "3", *output])
+        load.main(["--catalog-size", "2000", "--duration", "5", *output])
+    else:
+        micro.main(output)
+        load.main(output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,107 @@
+"""
+Local stand-in for the Artic places API.
+
+Serves paginated ArticResponse payloads (GET /api/v1/places?page&limit) and the
+search endpoint used by remote lookups (GET /api/v1/places/search?q), over a
+synthetic catalog of "Artic place {n}" titles with a fixed per-request latency.
+
+    python -m benchmarks.artic_stub --size 20000 --latency 0.05 --port 8900
+    ARTIC_BASE_URL=http://127.0.0.1:8900/api/v1/places uvicorn app.api.main:app
+"""
+import argparse
+import asyncio
+import math
+import random
+import socket
+import sys
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, Query, Response
+
+PLACES_PATH = "/api/v1/places"
+
+
+def stub_title(place_id: int) -> str:
+    return f"Artic place {place_id}"
+
+
+def create_stub_app(size: int, latency: float = 0.0, error_rate: float = 0.0, seed: int = 0) -> FastAPI:
+    """Catalog ids are 1..size. error_rate is the share of page requests answered with 503."""
+    app = FastAPI(title="Artic API stand-in")
+    rng = random.Random(seed)
+    titles = {stub_title(place_id): place_id for place_id in range(1, size + 1)}
+
+    @app.get(PLACES_PATH)
+    async def places(response: Response, page: int = 1, limit: int = Query(12, le=100)):
+        if latency:
+            await asyncio.sleep(latency)
+        if error_rate and rng.random() < error_rate:
+            response.status_code = 503
+            return {"detail": "stand-in failure"}
+
+        total_pages = max(math.ceil(size / limit), 1)
+        first = (page - 1) * limit + 1
+        data = [{"id": p_id, "title": stub_title(p_id)} for p_id in range(first, min(first + limit, size + 1))]
+        next_url = f"http://stub{PLACES_PATH}?page={page + 1}&limit={limit}" if page < total_pages else None
+        return {"pagination": {"total_pages": total_pages, "next_url": next_url}, "data": data}
+
+    @app.get(f"{PLACES_PATH}/search")
+    async def search(q: str, limit: int = 10):
+        if latency:
+            await asyncio.sleep(latency)
+        place_id = titles.get(q)
+        return {"data": [{"id": place_id, "title": q}] if place_id is not None else []}
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StubServer:
+    """Runs the stand-in in a background thread for the duration of a with block."""
+
+    def __init__(self, size: int, latency: float = 0.0, error_rate: float = 0.0, port: int | None = None):
+        self.port = port or free_port()
+        config = uvicorn.Config(
+            create_stub_app(size, latency, error_rate), host="127.0.0.1", port=self.port, log_level="warning"
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="artic-stub", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}{PLACES_PATH}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Artic stand-in didn't start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.should_exit = True
+        self._thread.join()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=10_000, help="Places in the catalog")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of page requests failing with 503")
+    parser.add_argument("--port", type=int, default=8900)
+    args = parser.parse_args(argv)
+
+    uvicorn.run(create_stub_app(args.size, args.latency, args.error_rate), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
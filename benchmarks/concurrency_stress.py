@@ -0,0 +1,185 @@
+"""
+Stress test of TravelManager under many threads.
+
+Every thread runs its own event loop and fires a random mix of create_project,
+add_place_to_project, mark_place_visited_by_id, remove_project, update_project
+and list reads against the shared manager. Afterwards it checks the invariants:
+unique project and place ids, no project above PLACES_LIMIT, no project removed
+after one of its places was marked visited, and consistent indexes. Any error
+other than the domain errors counts as a violation too.
+Prints one JSON line and exits with 1 if any invariant is broken.
+
+    python -m benchmarks.concurrency_stress
+    python -m benchmarks.concurrency_stress --threads 32 --ops 5000
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import threading
+import time
+
+from app.api.models.models import PlaceCreate, ProjectCreate, ProjectUpdate
+from app.core.config.config import travel_project_settings
+from app.services.artic_place_fetcher.artic_place_fetcher import ArticPlaceFetcher
+from app.services.travel_manager.errors.errors import ProjectBaseError
+from app.services.travel_manager.place.place import ProjectPlace
+from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.travel_manager import TravelManager
+
+CATALOG_SIZE = 200
+
+
+class _Recorder:
+    """What the worker threads saw succeed, merged under a lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.project_ids: list[int] = []
+        self.place_ids: list[int] = []
+        self.visited_projects: set[int] = set()
+        self.removed_projects: set[int] = set()
+        self.ops = 0
+        self.errors = 0
+        # thread seed -> (unexpected error count, first one)
+        self.unexpected: dict[int, tuple[int, str]] = {}
+
+
+def _place(rng: random.Random) -> PlaceCreate:
+    return PlaceCreate(name=f"Artic place {rng.randrange(CATALOG_SIZE)}")
+
+
+def _worker(manager: TravelManager, recorder: _Recorder, ops: int, seed: int):
+    rng = random.Random(seed)
+    loop = asyncio.new_event_loop()
+    project_ids, place_ids, visited, removed = [], [], set(), set()
+    errors = 0
+    unexpected, first_unexpected = 0, ""
+
+    for _ in range(ops):
+        # Targets are picked from everything created so far, by any thread
+        known_projects = recorder.project_ids
+        target = rng.choice(known_projects) if known_projects else 0
+        op = rng.random()
+        try:
+            if op < 0.25:
+                places = [_place(rng) for _ in range(rng.randrange(4))]
+                project, _ = loop.run_until_complete(manager.create_project(ProjectCreate(name=f"Trip {seed}", places=places)))
+                project_ids.append(project._id)
+                place_ids.extend(project.get_place_ids())
+                with recorder.lock:
+                    recorder.project_ids.append(project._id)
+            elif op < 0.50:
+                place = loop.run_until_complete(manager.add_place_to_project(target, _place(rng)))
+                place_ids.append(place.id)
+            elif op < 0.60:
+                place_id = rng.choice(place_ids) if place_ids else 0
+                visited.add(manager.mark_place_visited_by_id(place_id).project_id)
+            elif op < 0.75:
+                manager.remove_project(target)
+                removed.add(target)
+            elif op < 0.80:
+                manager.update_project(ProjectUpdate(id=target, name=f"Renamed {seed}"))
+            else:
+                manager.query_projects_json(limit=50, offset=rng.randrange(100), name_filter=rng.choice([None, "Trip"]))
+        except ProjectBaseError:
+            errors += 1
+        except Exception as e:
+            # Anything but the domain errors means the manager broke under concurrency
+            unexpected += 1
+            first_unexpected = first_unexpected or f"{type(e).__name__}: {e}"
+
+    loop.close()
+    with recorder.lock:
+        recorder.place_ids.extend(place_ids)
+        recorder.visited_projects |= visited
+        recorder.removed_projects |= removed
+        recorder.ops += ops
+        recorder.errors += errors
+        if unexpected:
+            recorder.unexpected[seed] = (unexpected, first_unexpected)
+
+
+def _check(manager: TravelManager, recorder: _Recorder) -> list[str]:
+    violations = [
+        f"thread {seed}: {count} unexpected errors, first {first}"
+        for seed, (count, first) in sorted(recorder.unexpected.items())
+    ]
+
+    if len(set(recorder.project_ids)) != len(recorder.project_ids):
+        violations.append("duplicate project ids")
+    if len(set(recorder.place_ids)) != len(recorder.place_ids):
+        violations.append("duplicate place ids")
+
+    over_limit = [p._id for p in manager._projects.values() if p.get_places_count() > travel_project_settings.PLACES_LIMIT]
+    if over_limit:
+        violations.append(f"projects over PLACES_LIMIT: {over_limit[:10]}")
+
+    removed_visited = recorder.visited_projects & recorder.removed_projects
+    if removed_visited:
+        violations.append(f"removed projects with visited places: {sorted(removed_visited)[:10]}")
+
+    ids, count = manager._project_ids.view()
+    if ids[:count] != sorted(manager._projects):
+        violations.append("project id list out of sync with projects")
+
+    indexed = {place_id: project._id for project in manager._projects.values() for place_id in project.get_place_ids()}
+    if indexed != manager._place_index:
+        violations.append("place index out of sync with projects")
+
+    return violations
+
+
+def run(threads: int, ops: int, switch_interval: float) -> dict:
+    TravelManager._instance = None
+    TravelProject._ids.reset()
+    ProjectPlace._ids.reset()
+    manager = TravelManager()
+    recorder = _Recorder()
+
+    # Frequent thread switches make interleavings inside the manager far more likely
+    sys.setswitchinterval(switch_interval)
+    workers = [threading.Thread(target=_worker, args=(manager, recorder, ops, seed)) for seed in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    violations = _check(manager, recorder)
+    return {
+        "benchmark": "concurrency_stress",
+        "threads": threads,
+        "ops": recorder.ops,
+        "rejected": recorder.errors,
+        "projects": len(manager._projects),
+        "ops_per_second": round(recorder.ops / elapsed),
+        "violations": violations,
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=2_000, help="Operations per thread")
+    parser.add_argument("--switch-interval", type=float, default=1e-6)
+    args = parser.parse_args(argv)
+
+    # Per-entity INFO logs would dominate the run
+    logging.disable(logging.CRITICAL)
+
+    fetcher = ArticPlaceFetcher()
+    fetcher._catalog.update({i: f"Artic place {i}" for i in range(CATALOG_SIZE)})
+    fetcher._mark_ready()
+
+    result = run(args.threads, args.ops, args.switch_interval)
+    print(json.dumps(result), flush=True)
+    if result["violations"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,93 @@
+"""
+Recovery speed of the journal persistence backend.
+
+Writes a journal of create_project / add_place / mark_place_visited entries,
+then measures how fast a fresh JournalProjectRepository replays it, and how
+fast the same state loads once compacted into a snapshot. Results are JSON lines.
+
+    python -m benchmarks.journal_replay
+    python -m benchmarks.journal_replay --projects 100000 --places-per-project 5
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from app.api.models.models import PlaceCreate
+from app.database.journal.journal import JournalProjectRepository, JOURNAL_FILE, SNAPSHOT_FILE
+from app.services.travel_manager.place.place import ProjectPlace
+from app.services.travel_manager.project.project import TravelProject
+
+
+def _write_journal(directory: str, projects: int, places_per_project: int) -> int:
+    repository = JournalProjectRepository(directory, commit_interval=0, snapshot_every=0)
+    for i in range(projects):
+        project = TravelProject(f"Project {i}", "Imported")
+        repository.project_created(project)
+        for j in range(places_per_project):
+            place_id = project.add_place(j, PlaceCreate(name=f"Artic place {(i + j) % 5_000}")).id
+            repository.place_added(project, project.get_place(place_id))
+        if places_per_project and i % 2 == 0:
+            project.mark_place_visited(place_id)
+            repository.place_updated(project, project.get_place(place_id))
+
+    entries = repository._seq
+    repository.close()
+    return entries
+
+
+def _timed_open(directory: str, snapshot_every: int) -> tuple[float, JournalProjectRepository]:
+    started = time.perf_counter()
+    repository = JournalProjectRepository(directory, commit_interval=0, snapshot_every=snapshot_every)
+    return time.perf_counter() - started, repository
+
+
+def measure(projects: int, places_per_project: int) -> dict:
+    TravelProject._ids.reset()
+    ProjectPlace._ids.reset()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 1. Journal only
+        entries = _write_journal(directory, projects, places_per_project)
+        journal_bytes = os.path.getsize(os.path.join(directory, JOURNAL_FILE))
+        replay_seconds, repository = _timed_open(directory, snapshot_every=0)
+        repository.close()
+
+        # 2. Compact into a snapshot on close, then load it
+        _, repository = _timed_open(directory, snapshot_every=1)
+        repository.close()
+        snapshot_bytes = os.path.getsize(os.path.join(directory, SNAPSHOT_FILE))
+        snapshot_seconds, repository = _timed_open(directory, snapshot_every=0)
+        repository.close()
+
+    return {
+        "benchmark": "journal_replay",
+        "projects": projects,
+        "places_per_project": places_per_project,
+        "entries": entries,
+        "journal_mib": round(journal_bytes / 2 ** 20, 1),
+        "replay_seconds": round(replay_seconds, 3),
+        "entries_per_second": round(entries / replay_seconds),
+        "snapshot_mib": round(snapshot_bytes / 2 ** 20, 1),
+        "snapshot_load_seconds": round(snapshot_seconds, 3),
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--places-per-project", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Per-entity INFO logs would dominate the timings
+    logging.disable(logging.CRITICAL)
+
+    for projects in args.projects:
+        print(json.dumps(measure(projects, args.places_per_project)), flush=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,198 @@
+"""
+End-to-end load scenario against the FastAPI app.
+
+Starts the Artic stand-in, boots the app with uvicorn in a subprocess pointed at
+it (no snapshot, so startup includes the full crawl), then runs --concurrency
+clients for --duration seconds over a mix of project and place routes.
+Reports the time until the app serves and until its catalog is ready, then
+throughput and p50/p99 latency per route, as JSON lines.
+
+    python -m benchmarks.load
+    python -m benchmarks.load --catalog-size 20000 --latency 0.02 --concurrency 64 --output results.jsonl
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import httpx
+
+from benchmarks.artic_stub import StubServer, free_port, stub_title
+from benchmarks.results import emit, open_output, percentile
+
+# Route template -> share of the requests
+SCENARIO = {
+    "POST /projects/": 0.15,
+    "POST /projects/{id}/places/": 0.10,
+    "GET /projects/{id}": 0.30,
+    "GET /projects/": 0.20,
+    "GET /places/{id}": 0.10,
+    "PATCH /places/{id}/visited": 0.05,
+    "GET /places/search": 0.10,
+}
+
+
+class _State:
+    def __init__(self):
+        self.project_ids: list[int] = []
+        self.place_ids: list[int] = []
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+
+async def _request(client: httpx.AsyncClient, state: _State, route: str, rng: random.Random, catalog_size: int):
+    def catalog_name() -> str:
+        return stub_title(rng.randrange(1, catalog_size + 1))
+
+    project_id = rng.choice(state.project_ids) if state.project_ids else 0
+    place_id = rng.choice(state.place_ids) if state.place_ids else 0
+
+    if route == "POST /projects/":
+        places = [{"name": catalog_name()} for _ in range(rng.randrange(1, 4))]
+        call = client.post("/projects/", json={"name": f"Load {rng.random():.6f}", "places": places})
+    elif route == "POST /projects/{id}/places/":
+        call = client.post(f"/projects/{project_id}/places/", json={"name": catalog_name()})
+    elif route == "GET /projects/{id}":
+        call = client.get(f"/projects/{project_id}")
+    elif route == "GET /projects/":
+        call = client.get("/projects/", params={"limit": 20, "offset": rng.randrange(max(len(state.project_ids), 1))})
+    elif route == "GET /places/{id}":
+        call = client.get(f"/places/{place_id}")
+    elif route == "PATCH /places/{id}/visited":
+        call = client.patch(f"/places/{place_id}/visited")
+    else:
+        call = client.get("/places/search", params={"q": f"place {rng.randrange(catalog_size)}", "limit": 5})
+
+    started = time.perf_counter()
+    response = await call
+    state.latencies[route].append(time.perf_counter() - started)
+
+    # 4xx from business rules (full project, duplicate place) are expected in a random mix
+    if response.status_code >= 500:
+        state.errors[route] += 1
+        return
+    if route == "POST /projects/" and response.status_code in (201, 207):
+        project = response.json()["project"]
+        state.project_ids.append(project["id"])
+        state.place_ids.extend(place["id"] for place in project["places"])
+    elif route == "POST /projects/{id}/places/" and response.status_code == 201:
+        state.place_ids.append(response.json()["id"])
+
+
+async def _client(base_url: str, state: _State, deadline: float, seed: int, catalog_size: int):
+    rng = random.Random(seed)
+    routes, weights = list(SCENARIO), list(SCENARIO.values())
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        while time.perf_counter() < deadline:
+            route = rng.choices(routes, weights)[0]
+            await _request(client, state, route, rng, catalog_size)
+
+
+async def _run_load(base_url: str, concurrency: int, duration: float, catalog_size: int) -> tuple[_State, float]:
+    state = _State()
+    # Seed a few projects so reads have targets from the start
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        rng = random.Random(-1)
+        for _ in range(20):
+            await _request(client, state, "POST /projects/", rng, catalog_size)
+    state.latencies.clear()
+
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(_client(base_url, state, deadline, seed, catalog_size) for seed in range(concurrency)))
+    return state, time.perf_counter() - started
+
+
+def _start_app(port: int, artic_url: str, extra_env: dict[str, str]) -> tuple[subprocess.Popen, float, float]:
+    env = {
+        **os.environ,
+        "ARTIC_BASE_URL": artic_url,
+        "ARTIC_SNAPSHOT_ENABLED": "false",
+        "LOG_CONSOLE_LEVEL": "50",
+        **extra_env,
+    }
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.api.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+
+    # Live as soon as uvicorn serves, ready once the background catalog load is done
+    live_seconds = None
+    deadline = started + 300
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health/ready", timeout=1).status_code == 200:
+                ready_seconds = time.perf_counter() - started
+                return process, live_seconds or ready_seconds, ready_seconds
+            if live_seconds is None:
+                live_seconds = time.perf_counter() - started
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+
+    process.terminate()
+    raise RuntimeError("App didn't become ready")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog-size", type=int, default=10_000)
+    parser.add_argument("--latency", type=float, default=0.01, help="Artic stand-in latency per request, seconds")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds of load")
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE", help="Extra app settings")
+    parser.add_argument("--output", help="Append results to this JSON lines file")
+    args = parser.parse_args(argv)
+
+    extra_env = dict(item.split("=", 1) for item in args.env)
+    output = open_output(args.output)
+    common = {"catalog_size": args.catalog_size, "artic_latency": args.latency, "concurrency": args.concurrency}
+
+    with StubServer(args.catalog_size, args.latency) as stub:
+        port = free_port()
+        process, live_seconds, ready_seconds = _start_app(port, stub.base_url, extra_env)
+        try:
+            emit({
+                "benchmark": "load.startup",
+                **common,
+                "live_seconds": round(live_seconds, 3),
+                "seconds": round(ready_seconds, 3),
+            }, output)
+            state, elapsed = asyncio.run(_run_load(f"http://127.0.0.1:{port}", args.concurrency, args.duration, args.catalog_size))
+        finally:
+            process.terminate()
+            process.wait()
+
+    total = 0
+    for route in SCENARIO:
+        latencies = sorted(state.latencies[route])
+        total += len(latencies)
+        emit({
+            "benchmark": "load.route",
+            **common,
+            "route": route,
+            "requests": len(latencies),
+            "errors": state.errors[route],
+            "requests_per_second": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+        }, output)
+
+    emit({
+        "benchmark": "load.total",
+        **common,
+        "requests": total,
+        "errors": sum(state.errors.values()),
+        "requests_per_second": round(total / elapsed, 1),
+    }, output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,100 @@
+"""
+Memory footprint of the in-memory project store.
+
+Creates projects through TravelManager.create_project (so the manager's indexes
+are included) and reports traced bytes per project and per place as JSON lines.
+
+    python -m benchmarks.memory_footprint
+    python -m benchmarks.memory_footprint --projects 100000 --places-per-project 5
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+
+from app.api.models.models import ProjectCreate, PlaceCreate
+from app.services.artic_place_fetcher.artic_place_fetcher import ArticPlaceFetcher
+from app.services.travel_manager.place.place import ProjectPlace
+from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.travel_manager import TravelManager
+
+# Realistic-ish catalog: places reuse a limited set of Artic titles
+CATALOG_SIZE = 5_000
+
+
+def _fresh_manager() -> TravelManager:
+    TravelManager._instance = None
+    TravelProject._ids.reset()
+    ProjectPlace._ids.reset()
+    return TravelManager()
+
+
+async def _fill(manager: TravelManager, projects: int, places_per_project: int):
+    for i in range(projects):
+        places = [
+            PlaceCreate(name=f"Artic place {(i + j) % CATALOG_SIZE}")
+            for j in range(places_per_project)
+        ]
+        await manager.create_project(ProjectCreate(name=f"Project {i}", description="Imported", places=places))
+
+
+def measure(projects: int, places_per_project: int) -> dict:
+    # 1. Projects without places
+    manager = _fresh_manager()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    asyncio.run(_fill(manager, projects, 0))
+    gc.collect()
+    project_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del manager
+
+    # 2. Same projects with places, the difference is the cost of the places
+    manager = _fresh_manager()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    asyncio.run(_fill(manager, projects, places_per_project))
+    gc.collect()
+    total_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    elapsed = time.perf_counter() - started
+    del manager
+
+    total_places = projects * places_per_project
+    return {
+        "benchmark": "memory_footprint",
+        "projects": projects,
+        "places_per_project": places_per_project,
+        "bytes_per_project": round(project_bytes / projects, 1),
+        "bytes_per_place": round((total_bytes - project_bytes) / total_places, 1) if total_places else None,
+        "total_mib": round(total_bytes / 2 ** 20, 1),
+        "seconds": round(elapsed, 2),
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--places-per-project", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Per-entity INFO logs would dominate both time and memory
+    logging.disable(logging.CRITICAL)
+
+    fetcher = ArticPlaceFetcher()
+    fetcher._catalog.update({i: f"Artic place {i}" for i in range(CATALOG_SIZE)})
+    fetcher._mark_ready()
+
+    for projects in args.projects:
+        print(json.dumps(measure(projects, args.places_per_project)), flush=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,181 @@
+"""
+Microbenchmarks of the hot paths.
+
+    get_place_id          exact and normalized catalog lookups, hits and misses
+    add_place             TravelProject.add_place up to PLACES_LIMIT
+    list_projects         TravelManager.list_projects and one query_projects page
+    search_projects       full-text search, a rare word and a word in every project
+    response_model        TravelProject.get_response_model, cold and cached JSON
+
+Each case reports the median and best time per operation over --repeat runs,
+one JSON line per case.
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --catalog-size 100000 --projects 10000 --output results.jsonl
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from typing import Callable
+
+from app.api.models.models import PlaceCreate, ProjectCreate
+from app.core.config.config import travel_project_settings
+from app.services.artic_place_fetcher.artic_place_fetcher import ArticPlaceFetcher
+from app.services.travel_manager.place.place import ProjectPlace
+from app.services.travel_manager.project.project import TravelProject
+from app.services.travel_manager.travel_manager import TravelManager
+from benchmarks.artic_stub import stub_title
+from benchmarks.results import emit, open_output
+
+
+def _time_case(case: Callable[[], int], repeat: int) -> dict:
+    """case runs one batch and returns how many operations it did."""
+    per_op = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        ops = case()
+        per_op.append((time.perf_counter_ns() - started) / ops)
+    return {
+        "ops_per_run": ops,
+        "median_ns": round(statistics.median(per_op)),
+        "best_ns": round(min(per_op)),
+    }
+
+
+def _fresh_manager(projects: int, places_per_project: int) -> TravelManager:
+    TravelManager._instance = None
+    TravelProject._ids.reset()
+    ProjectPlace._ids.reset()
+    manager = TravelManager()
+
+    async def fill():
+        for i in range(projects):
+            places = [PlaceCreate(name=stub_title((i + j) % 1_000 + 1)) for j in range(places_per_project)]
+            await manager.create_project(ProjectCreate(name=f"Project {i}", places=places))
+
+    asyncio.run(fill())
+    return manager
+
+
+def bench_get_place_id(fetcher: ArticPlaceFetcher, catalog_size: int, batch: int) -> dict[str, Callable[[], int]]:
+    hits = [stub_title(i % catalog_size + 1) for i in range(batch)]
+    normalized_hits = [f"  {name.upper()} " for name in hits]
+    misses = [f"Missing place {i}" for i in range(batch)]
+
+    def lookups(names: list[str], normalized: bool) -> Callable[[], int]:
+        def run() -> int:
+            for name in names:
+                fetcher.get_place_id(name, normalized)
+            return len(names)
+        return run
+
+    return {
+        "get_place_id.hit": lookups(hits, False),
+        "get_place_id.miss": lookups(misses, False),
+        "get_place_id.normalized_hit": lookups(normalized_hits, True),
+    }
+
+
+def bench_add_place(batch: int) -> dict[str, Callable[[], int]]:
+    limit = travel_project_settings.PLACES_LIMIT
+    places = [PlaceCreate(name=stub_title(i + 1), note="Bench") for i in range(limit)]
+
+    def run() -> int:
+        ops = 0
+        for _ in range(max(batch // limit, 1)):
+            project = TravelProject("Bench")
+            for artic_id, place in enumerate(places):
+                project.add_place(artic_id, place)
+            ops += limit
+        return ops
+
+    return {"add_place": run}
+
+
+def bench_listing(manager: TravelManager) -> dict[str, Callable[[], int]]:
+    def list_all() -> int:
+        return len(manager.list_projects())
+
+    def query_page() -> int:
+        manager.query_projects(limit=50, offset=len(manager._projects) // 2)
+        return 1
+
+    def query_page_json() -> int:
+        manager.query_projects_json(limit=50, offset=len(manager._projects) // 2)
+        return 1
+
+    def search(query: str) -> Callable[[], int]:
+        def run() -> int:
+            manager.search_projects(query, limit=10)
+            return 1
+        return run
+
+    # Projects created after startup are indexed as they are added
+    manager._search_index.wait_built()
+
+    return {
+        "list_projects.per_project": list_all,
+        "query_projects.page_50": query_page,
+        "query_projects_json.page_50": query_page_json,
+        "search_projects.rare_word": search(str(len(manager._projects) // 2)),
+        "search_projects.common_word": search("project"),
+    }
+
+
+def bench_response_model(manager: TravelManager, batch: int) -> dict[str, Callable[[], int]]:
+    projects = list(manager._projects.values())[:batch]
+
+    def build() -> int:
+        for project in projects:
+            project.get_response_model()
+        return len(projects)
+
+    def cached_json() -> int:
+        for project in projects:
+            manager.get_project_json(project._id)
+        return len(projects)
+
+    return {"response_model.build": build, "response_model.cached_json": cached_json}
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog-size", type=int, default=50_000)
+    parser.add_argument("--projects", type=int, default=2_000)
+    parser.add_argument("--places-per-project", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=10_000, help="Operations per timed run")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", help="Append results to this JSON lines file")
+    args = parser.parse_args(argv)
+
+    # Per-entity INFO logs would dominate the timings
+    logging.disable(logging.CRITICAL)
+
+    fetcher = ArticPlaceFetcher()
+    fetcher._catalog.update({i: stub_title(i) for i in range(1, args.catalog_size + 1)})
+    fetcher._mark_ready()
+    manager = _fresh_manager(args.projects, args.places_per_project)
+
+    cases = {
+        **bench_get_place_id(fetcher, args.catalog_size, args.batch),
+        **bench_add_place(args.batch),
+        **bench_listing(manager),
+        **bench_response_model(manager, args.batch),
+    }
+
+    output = open_output(args.output)
+    for name, case in cases.items():
+        emit({
+            "benchmark": "micro",
+            "case": name,
+            "catalog_size": args.catalog_size,
+            "projects": args.projects,
+            **_time_case(case, args.repeat),
+        }, output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
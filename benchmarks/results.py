@@ -0,0 +1,45 @@
+"""Shared output helpers: one JSON object per line, tagged with the commit it measured."""
+import json
+import math
+import platform
+import subprocess
+import time
+from functools import lru_cache
+from typing import Sequence, TextIO
+
+
+@lru_cache(maxsize=1)
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def emit(result: dict, output: TextIO | None = None):
+    """Prints the result and appends it to output, if given, for comparing runs across commits."""
+    record = {
+        **result,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "timestamp": round(time.time()),
+    }
+    line = json.dumps(record)
+    print(line, flush=True)
+    if output is not None:
+        output.write(line + "\n")
+        output.flush()
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float | None:
+    """Nearest-rank percentile of an ascending sequence, q in [0, 100]."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(q / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def open_output(path: str | None) -> TextIO | None:
+    return open(path, "a", encoding="utf-8") if path else None